@@ -0,0 +1,35 @@
+"""add smart warnings
+
+Revision ID: 3f6d1b8a2c47
+Revises: e7a2c5d93f16
+Create Date: 2026-02-18 09:47:12.630158
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f6d1b8a2c47'
+down_revision = 'e7a2c5d93f16'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'smart_warnings',
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('type', sa.String(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('message', sa.String(), nullable=False),
+        sa.Column('icon', sa.String(), nullable=False),
+        sa.Column('date', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id', 'id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('smart_warnings')
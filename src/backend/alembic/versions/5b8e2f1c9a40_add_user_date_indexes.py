@@ -0,0 +1,34 @@
+"""add user date indexes
+
+Revision ID: 5b8e2f1c9a40
+Revises: cec6af6765d5
+Create Date: 2026-02-03 10:14:52.118204
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5b8e2f1c9a40'
+down_revision = 'cec6af6765d5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keyset pagination walks (user_id, date, id) in order
+    op.create_index(
+        'ix_expenses_user_id_date_id',
+        'expenses',
+        ['user_id', 'date', 'id']
+    )
+    op.create_index(
+        'ix_incomes_user_id_date_id',
+        'incomes',
+        ['user_id', 'date', 'id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_incomes_user_id_date_id', table_name='incomes')
+    op.drop_index('ix_expenses_user_id_date_id', table_name='expenses')
@@ -0,0 +1,50 @@
+"""add monthly rollups
+
+Revision ID: 8d3a61f0b7e2
+Revises: 5b8e2f1c9a40
+Create Date: 2026-02-09 16:42:05.531877
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d3a61f0b7e2'
+down_revision = '5b8e2f1c9a40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'monthly_rollups',
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('month', sa.String(length=7), nullable=False),
+        sa.Column('category', sa.String(), nullable=False),
+        sa.Column('type', sa.String(), nullable=False),
+        sa.Column('total', sa.Float(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id', 'month', 'category', 'type')
+    )
+
+    # Backfill from existing rows
+    op.execute("""
+        INSERT INTO monthly_rollups (user_id, month, category, type, total, count)
+        SELECT user_id, substr(date, 1, 7), category,
+               CASE WHEN type = 'ESSENTIAL' THEN 'essential' ELSE 'non-essential' END,
+               sum(amount), count(*)
+        FROM expenses
+        GROUP BY user_id, substr(date, 1, 7), category, type
+    """)
+    op.execute("""
+        INSERT INTO monthly_rollups (user_id, month, category, type, total, count)
+        SELECT user_id, substr(date, 1, 7), source, 'income', sum(amount), count(*)
+        FROM incomes
+        GROUP BY user_id, substr(date, 1, 7), source
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('monthly_rollups')
@@ -0,0 +1,35 @@
+"""add investment indexes
+
+Revision ID: a9c4e1f27b38
+Revises: 3f6d1b8a2c47
+Create Date: 2026-02-23 14:31:06.775192
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9c4e1f27b38'
+down_revision = '3f6d1b8a2c47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Holdings group one user's rows by fund
+    op.create_index(
+        'ix_investments_user_id_fund_name',
+        'investments',
+        ['user_id', 'fund_name']
+    )
+    # Keyset pagination walks (user_id, date, id) in order
+    op.create_index(
+        'ix_investments_user_id_date_id',
+        'investments',
+        ['user_id', 'date', 'id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_investments_user_id_date_id', table_name='investments')
+    op.drop_index('ix_investments_user_id_fund_name', table_name='investments')
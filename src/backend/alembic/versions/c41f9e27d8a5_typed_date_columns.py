@@ -0,0 +1,81 @@
+"""typed date columns
+
+Revision ID: c41f9e27d8a5
+Revises: 8d3a61f0b7e2
+Create Date: 2026-02-14 11:03:27.904615
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41f9e27d8a5'
+down_revision = '8d3a61f0b7e2'
+branch_labels = None
+depends_on = None
+
+
+# (table, column) pairs stored as ISO text until now
+DATE_COLUMNS = [
+    ('expenses', 'date'),
+    ('incomes', 'date'),
+    ('goals', 'deadline'),
+    ('investments', 'date'),
+]
+
+
+def _backfill_and_validate(bind, table, column):
+    # Trim timestamps such as "2024-01-05T00:00:00.000Z" down to the date part
+    op.execute(
+        f"UPDATE {table} SET {column} = substr({column}, 1, 10) WHERE length({column}) > 10"
+    )
+
+    if bind.dialect.name == "postgresql":
+        invalid = f"{column} !~ '^[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}$'"
+    else:
+        invalid = f"{column} NOT GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'"
+
+    rows = bind.execute(sa.text(f"SELECT id, {column} FROM {table} WHERE {invalid} LIMIT 10")).all()
+    if rows:
+        sample = ", ".join(f"{row_id}={value!r}" for row_id, value in rows)
+        raise RuntimeError(
+            f"{table}.{column} has values that are not YYYY-MM-DD dates ({sample}); "
+            "fix them before running this migration"
+        )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    for table, column in DATE_COLUMNS:
+        _backfill_and_validate(bind, table, column)
+
+        if bind.dialect.name == "postgresql":
+            op.alter_column(
+                table,
+                column,
+                type_=sa.Date(),
+                existing_nullable=False,
+                postgresql_using=f"{column}::date",
+            )
+        else:
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.alter_column(column, type_=sa.Date(), existing_nullable=False)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    for table, column in DATE_COLUMNS:
+        if bind.dialect.name == "postgresql":
+            op.alter_column(
+                table,
+                column,
+                type_=sa.String(),
+                existing_nullable=False,
+                postgresql_using=f"to_char({column}, 'YYYY-MM-DD')",
+            )
+        else:
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.alter_column(column, type_=sa.String(), existing_nullable=False)
@@ -0,0 +1,46 @@
+"""add system stats
+
+Revision ID: d2b7f4c81e63
+Revises: a9c4e1f27b38
+Create Date: 2026-02-25 11:08:44.391027
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2b7f4c81e63'
+down_revision = 'a9c4e1f27b38'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'system_stats',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('shard', sa.Integer(), nullable=False),
+        sa.Column('value', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('name', 'shard')
+    )
+
+    # Backfill the running totals into shard 0; hourly signup buckets start empty
+    op.execute("""
+        INSERT INTO system_stats (name, shard, value)
+        SELECT 'users', 0, count(*) FROM users
+        UNION ALL SELECT 'profiles', 0, count(*) FROM user_profiles
+        UNION ALL SELECT 'expenses', 0, count(*) FROM expenses
+        UNION ALL SELECT 'expense_amount', 0, coalesce(sum(amount), 0) FROM expenses
+        UNION ALL SELECT 'goals', 0, count(*) FROM goals
+        UNION ALL SELECT 'goal_saved', 0, coalesce(sum(saved_amount), 0) FROM goals
+        UNION ALL SELECT 'goal_completion', 0,
+            coalesce(sum(CASE WHEN target_amount <> 0 THEN saved_amount * 100.0 / target_amount ELSE 0 END), 0)
+            FROM goals
+        UNION ALL SELECT 'investments', 0, count(*) FROM investments
+        UNION ALL SELECT 'investment_amount', 0, coalesce(sum(amount), 0) FROM investments
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('system_stats')
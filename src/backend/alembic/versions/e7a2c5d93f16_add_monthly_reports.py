@@ -0,0 +1,33 @@
+"""add monthly reports
+
+Revision ID: e7a2c5d93f16
+Revises: c41f9e27d8a5
+Create Date: 2026-02-16 10:12:48.204311
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a2c5d93f16'
+down_revision = 'c41f9e27d8a5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'monthly_reports',
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('month', sa.String(length=7), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('closed', sa.Boolean(), nullable=False),
+        sa.Column('generated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('user_id', 'month')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('monthly_reports')
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+
+from ..core.config import settings
+from ..core.database import get_async_db
+from ..schemas.schemas import AdminStats
+from ..services.admin_stats import read_stats, system_alerts
+from ..services.user_context import CurrentUser
+from .auth import get_current_user
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+ADMIN_EMAILS = {email.strip().lower() for email in settings.ADMIN_EMAILS.split(",") if email.strip()}
+
+
+async def get_current_admin(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
+    if current_user.email.lower() not in ADMIN_EMAILS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    return current_user
+
+
+@router.get("/stats", response_model=AdminStats)
+async def get_system_stats(
+    current_admin: CurrentUser = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    now = datetime.utcnow()
+    stats = await read_stats(db, now)
+
+    goals = stats["goals"]
+    return {
+        "total_users": int(stats["users"]),
+        "new_users_24h": int(stats["new_users_24h"]),
+        "total_profiles": int(stats["profiles"]),
+        "total_expenses": stats["expense_amount"],
+        "total_transactions": int(stats["expenses"]),
+        "total_investments": stats["investment_amount"],
+        "investment_count": int(stats["investments"]),
+        "total_goals": int(goals),
+        "total_goals_saved": stats["goal_saved"],
+        "avg_goal_completion": round(stats["goal_completion"] / goals) if goals else 0,
+        "alerts": system_alerts(stats, now),
+    }
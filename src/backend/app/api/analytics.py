@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date
+
+from ..core.database import get_async_db
+from ..schemas.schemas import AnalyticsSummary, CategoryTotal, MonthlySummary
+from ..services.analytics import (
+    category_summary,
+    expense_groups,
+    income_groups,
+    monthly_summary,
+    totals_summary,
+)
+from ..services.user_context import CurrentUser
+from .auth import get_current_user
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+
+@router.get("/summary", response_model=AnalyticsSummary)
+async def get_summary(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    expense_rows = await expense_groups(db, current_user.id, start_date, end_date)
+    income_rows = await income_groups(db, current_user.id, start_date, end_date)
+
+    return {
+        "totals": totals_summary(expense_rows, income_rows),
+        "monthly": monthly_summary(expense_rows, income_rows),
+        "categories": category_summary(expense_rows),
+    }
+
+
+@router.get("/summary/monthly", response_model=List[MonthlySummary])
+async def get_monthly_summary(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    expense_rows = await expense_groups(db, current_user.id, start_date, end_date)
+    income_rows = await income_groups(db, current_user.id, start_date, end_date)
+    return monthly_summary(expense_rows, income_rows)
+
+
+@router.get("/summary/categories", response_model=List[CategoryTotal])
+async def get_category_summary(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    expense_rows = await expense_groups(db, current_user.id, start_date, end_date)
+    return category_summary(expense_rows)
@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 import uuid
 
-from ..core.database import get_db
+from ..core.database import get_async_db
 from ..core.security import (
-    verify_password,
-    get_password_hash,
+    PasswordPoolBusy,
+    verify_password_async,
+    get_password_hash_async,
     create_access_token,
     create_refresh_token,
     decode_token
@@ -15,16 +17,18 @@ from ..core.security import (
 from ..core.config import settings
 from ..models.models import User
 from ..schemas.schemas import UserSignup, UserLogin, Token, UserResponse
+from ..services.repository import insert_one
+from ..services.user_context import CurrentUser, UserContext, load_user_context, invalidate_user
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 
-async def get_current_user(
+async def get_current_context(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
+    db: AsyncSession = Depends(get_async_db)
+) -> UserContext:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -39,34 +43,51 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
+    context = await load_user_context(db, user_id)
+    if context is None:
         raise credentials_exception
     
-    return user
+    return context
+
+
+async def get_current_user(
+    context: UserContext = Depends(get_current_context)
+) -> CurrentUser:
+    return context.user
+
+
+def password_pool_busy_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Server is busy, please try again shortly",
+        headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER_SECONDS)},
+    )
 
 
 @router.post("/signup", response_model=Token)
-async def signup(user_data: UserSignup, db: Session = Depends(get_db)):
+async def signup(user_data: UserSignup, db: AsyncSession = Depends(get_async_db)):
     # Check if user exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User already exists"
         )
     
+    try:
+        password_hash = await get_password_hash_async(user_data.password)
+    except PasswordPoolBusy:
+        raise password_pool_busy_exception()
+
     # Create new user
-    new_user = User(
-        id=str(uuid.uuid4()),
-        email=user_data.email,
-        name=user_data.name,
-        password_hash=get_password_hash(user_data.password)
-    )
-    
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    new_user = await insert_one(db, User, {
+        "id": str(uuid.uuid4()),
+        "email": user_data.email,
+        "name": user_data.name,
+        "password_hash": password_hash
+    })
+    await db.commit()
+    invalidate_user(new_user.id)
     
     # Create tokens
     access_token = create_access_token(data={"sub": new_user.id})
@@ -82,10 +103,16 @@ async def signup(user_data: UserSignup, db: Session = Depends(get_db)):
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.password_hash):
+    user = await db.scalar(select(User).where(User.email == form_data.username))
+
+    try:
+        password_ok = bool(user) and await verify_password_async(form_data.password, user.password_hash)
+    except PasswordPoolBusy:
+        raise password_pool_busy_exception()
+
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -101,7 +128,7 @@ async def login(
     }
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
+async def refresh_token(refresh_token: str, db: AsyncSession = Depends(get_async_db)):
     payload = decode_token(refresh_token)
     if payload is None or payload.get("type") != "refresh":
         raise HTTPException(
@@ -110,7 +137,7 @@ async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
         )
     
     user_id = payload.get("sub")
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.scalar(select(User).where(User.id == user_id))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -129,5 +156,5 @@ async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
-    return current_user
\ No newline at end of file
+async def get_current_user_info(current_user: CurrentUser = Depends(get_current_user)):
+    return current_user
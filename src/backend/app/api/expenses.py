@@ -1,63 +1,217 @@
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Body, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional
+from datetime import date
 import uuid
 
-from ..core.database import get_db
-from ..models.models import User, Expense
-from ..schemas.schemas import ExpenseCreate, ExpenseResponse
+from ..core.database import get_async_db
+from ..models.models import Expense, ExpenseType
+from ..schemas.schemas import (
+    BatchDeleteRequest,
+    BatchDeleteResult,
+    ExpenseCreate,
+    ExpenseBatchResult,
+    ExpenseResponse,
+    ExpenseImportSummary,
+    ImportRowError,
+)
+from ..services.batch import check_batch_size, reject_if_atomic, validate_batch
+from ..services.repository import delete_returning, insert_many, insert_one, insert_rows
+from ..services.statement_import import (
+    MAX_REPORTED_ERRORS,
+    ImportFormatError,
+    iter_csv_rows,
+    iter_expense_rows,
+    iter_xlsx_rows,
+    take,
+)
+from ..utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page
+from ..utils.serialization import response_columns, rows_response
+from ..services.user_context import CurrentUser
 from .auth import get_current_user
 
 router = APIRouter(prefix="/expenses", tags=["Expenses"])
 
+IMPORT_BATCH_SIZE = 5000
+
 
 @router.get("/", response_model=List[ExpenseResponse])
 async def get_expenses(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    category: Optional[str] = None,
+    type: Optional[ExpenseType] = None,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    expenses = db.query(Expense).filter(Expense.user_id == current_user.id).all()
-    return expenses
+    columns = response_columns(Expense, ExpenseResponse)
+    stmt = select(*columns).where(Expense.user_id == current_user.id)
+
+    if start_date:
+        stmt = stmt.where(Expense.date >= start_date)
+    if end_date:
+        stmt = stmt.where(Expense.date <= end_date)
+    if category:
+        stmt = stmt.where(Expense.category == category)
+    if type:
+        stmt = stmt.where(Expense.type == type)
+
+    rows, next_cursor = await keyset_page(db, stmt, Expense.date, Expense.id, cursor, limit)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+
+    return rows_response(rows, columns, headers)
 
 
 @router.post("/", response_model=ExpenseResponse, status_code=status.HTTP_201_CREATED)
 async def create_expense(
     expense_data: ExpenseCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    new_expense = Expense(
-        id=str(uuid.uuid4()),
-        user_id=current_user.id,
+    new_expense = await insert_one(db, Expense, {
+        "id": str(uuid.uuid4()),
+        "user_id": current_user.id,
         **expense_data.model_dump()
-    )
-    
-    db.add(new_expense)
-    db.commit()
-    db.refresh(new_expense)
+    })
+    await db.commit()
     
     return new_expense
 
 
+@router.post("/batch", response_model=ExpenseBatchResult, status_code=status.HTTP_201_CREATED)
+async def create_expenses_batch(
+    items: List[Dict[str, Any]] = Body(...),
+    atomic: bool = False,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    valid, errors = validate_batch(items, ExpenseCreate)
+    reject_if_atomic(atomic, errors)
+
+    created = []
+    if valid:
+        rows = [
+            {"id": str(uuid.uuid4()), "user_id": current_user.id, **item.model_dump()}
+            for _, item in valid
+        ]
+        # One multi-row INSERT ... RETURNING for the whole batch
+        created = await insert_many(db, Expense, rows)
+        await db.commit()
+
+    return {"created": created, "errors": errors}
+
+
+@router.delete("/batch", response_model=BatchDeleteResult)
+async def delete_expenses_batch(
+    request: BatchDeleteRequest,
+    atomic: bool = False,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    check_batch_size(len(request.ids))
+    ids = list(dict.fromkeys(request.ids))
+    deleted = set(await delete_returning(
+        db, Expense, [Expense.user_id == current_user.id, Expense.id.in_(ids)]
+    ))
+    not_found = [expense_id for expense_id in ids if expense_id not in deleted]
+
+    if atomic and not_found:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"not_found": not_found}
+        )
+
+    await db.commit()
+
+    return {"deleted": [expense_id for expense_id in ids if expense_id in deleted], "not_found": not_found}
+
+
+@router.post("/import", response_model=ExpenseImportSummary)
+async def import_expenses(
+    file: UploadFile = File(...),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    extension = (file.filename or "").rsplit(".", 1)[-1].lower()
+    if extension == "csv":
+        raw_rows = iter_csv_rows(file.file)
+    elif extension == "xlsx":
+        raw_rows = iter_xlsx_rows(file.file)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unsupported file format. Please use CSV or XLSX."
+        )
+
+    rows = iter_expense_rows(raw_rows, current_user.id)
+    summary = ExpenseImportSummary(
+        imported=0,
+        skipped=0,
+        total_amount=0,
+        essential_count=0,
+        non_essential_count=0,
+    )
+
+    # Parse in the threadpool one batch at a time; every batch is a single
+    # executemany INSERT and the whole file commits as one transaction.
+    try:
+        while True:
+            batch = await run_in_threadpool(take, rows, IMPORT_BATCH_SIZE)
+            if not batch:
+                break
+
+            values = []
+            for row_number, row, error in batch:
+                if error:
+                    summary.skipped += 1
+                    if len(summary.errors) < MAX_REPORTED_ERRORS:
+                        summary.errors.append(ImportRowError(row=row_number, detail=error))
+                    continue
+
+                values.append(row)
+                summary.total_amount += row["amount"]
+                if row["type"] == ExpenseType.ESSENTIAL:
+                    summary.essential_count += 1
+                else:
+                    summary.non_essential_count += 1
+
+            if values:
+                await insert_rows(db, Expense, values)
+                summary.imported += len(values)
+    except ImportFormatError as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    await db.commit()
+
+    return summary
+
+
 @router.delete("/{expense_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_expense(
     expense_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    expense = db.query(Expense).filter(
+    deleted = await delete_returning(db, Expense, [
         Expense.id == expense_id,
         Expense.user_id == current_user.id
-    ).first()
+    ])
     
-    if not expense:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Expense not found"
         )
     
-    db.delete(expense)
-    db.commit()
+    await db.commit()
     
     return None
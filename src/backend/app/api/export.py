@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+import importlib.util
+
+from ..services.export import DATASETS, MEDIA_TYPES, STREAMERS, ExportFormat
+from ..services.user_context import CurrentUser
+from .auth import get_current_user
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+
+@router.get("/{dataset}")
+async def export_dataset(
+    dataset: str,
+    format: ExportFormat = ExportFormat.CSV,
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    if dataset not in DATASETS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown dataset. Choose one of: {', '.join(DATASETS)}"
+        )
+
+    if format == ExportFormat.PARQUET and importlib.util.find_spec("pyarrow") is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Parquet export requires pyarrow to be installed"
+        )
+
+    model, order_by = DATASETS[dataset]
+    return StreamingResponse(
+        STREAMERS[format](model, order_by, current_user.id),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{dataset}.{format.value}"'},
+    )
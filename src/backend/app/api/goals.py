@@ -1,56 +1,163 @@
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional
 import uuid
 
-from ..core.database import get_db
-from ..models.models import User, Goal
-from ..schemas.schemas import GoalCreate, GoalUpdate, GoalResponse
+from ..core.database import get_async_db
+from ..models.models import Goal
+from ..schemas.schemas import (
+    BatchDeleteRequest,
+    BatchDeleteResult,
+    GoalCreate,
+    GoalBatchResult,
+    GoalUpdate,
+    GoalResponse,
+    GoalSimulation,
+)
+from ..services.batch import check_batch_size, reject_if_atomic, validate_batch
+from ..services.goal_simulation import simulate_goal
+from ..services.repository import delete_returning, insert_many, insert_one, update_one
+from ..services.user_context import CurrentUser
+from ..utils.serialization import response_columns, rows_response
 from .auth import get_current_user
 
 router = APIRouter(prefix="/goals", tags=["Goals"])
 
+MAX_SIMULATION_PATHS = 20000
+MAX_SIMULATION_MONTHS = 600
+
 
 @router.get("/", response_model=List[GoalResponse])
 async def get_goals(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    goals = db.query(Goal).filter(Goal.user_id == current_user.id).all()
-    return goals
+    columns = response_columns(Goal, GoalResponse)
+    rows = (await db.execute(select(*columns).where(Goal.user_id == current_user.id))).all()
+    return rows_response(rows, columns)
 
 
 @router.post("/", response_model=GoalResponse, status_code=status.HTTP_201_CREATED)
 async def create_goal(
     goal_data: GoalCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    new_goal = Goal(
-        id=str(uuid.uuid4()),
-        user_id=current_user.id,
+    new_goal = await insert_one(db, Goal, {
+        "id": str(uuid.uuid4()),
+        "user_id": current_user.id,
         **goal_data.model_dump()
-    )
-    
-    db.add(new_goal)
-    db.commit()
-    db.refresh(new_goal)
+    })
+    await db.commit()
     
     return new_goal
 
 
+@router.post("/batch", response_model=GoalBatchResult, status_code=status.HTTP_201_CREATED)
+async def create_goals_batch(
+    items: List[Dict[str, Any]] = Body(...),
+    atomic: bool = False,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    valid, errors = validate_batch(items, GoalCreate)
+    reject_if_atomic(atomic, errors)
+
+    created = []
+    if valid:
+        rows = [
+            {"id": str(uuid.uuid4()), "user_id": current_user.id, **item.model_dump()}
+            for _, item in valid
+        ]
+        # One multi-row INSERT ... RETURNING for the whole batch
+        created = await insert_many(db, Goal, rows)
+        await db.commit()
+
+    return {"created": created, "errors": errors}
+
+
+@router.delete("/batch", response_model=BatchDeleteResult)
+async def delete_goals_batch(
+    request: BatchDeleteRequest,
+    atomic: bool = False,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    check_batch_size(len(request.ids))
+    ids = list(dict.fromkeys(request.ids))
+    deleted = set(await delete_returning(
+        db, Goal, [Goal.user_id == current_user.id, Goal.id.in_(ids)]
+    ))
+    not_found = [goal_id for goal_id in ids if goal_id not in deleted]
+
+    if atomic and not_found:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"not_found": not_found}
+        )
+
+    await db.commit()
+
+    return {"deleted": [goal_id for goal_id in ids if goal_id in deleted], "not_found": not_found}
+
+
+@router.get("/{goal_id}/simulate", response_model=GoalSimulation)
+async def simulate_goal_feasibility(
+    goal_id: str,
+    monthly_contribution: float = Query(..., gt=0),
+    expected_return: float = Query(0.08, ge=-1, le=1),
+    volatility: float = Query(0.15, ge=0, le=1),
+    income_volatility: float = Query(0.1, ge=0, le=1),
+    paths: int = Query(10000, ge=100, le=MAX_SIMULATION_PATHS),
+    months: int = Query(360, ge=1, le=MAX_SIMULATION_MONTHS),
+    seed: Optional[int] = Query(None, ge=0),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    goal = (await db.execute(
+        select(Goal.target_amount, Goal.saved_amount, Goal.deadline)
+        .where(Goal.id == goal_id, Goal.user_id == current_user.id)
+    )).first()
+
+    if not goal:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Goal not found"
+        )
+
+    # CPU-bound NumPy work; keep it off the event loop
+    return await run_in_threadpool(
+        simulate_goal,
+        goal.target_amount,
+        goal.saved_amount,
+        goal.deadline,
+        monthly_contribution,
+        months,
+        paths,
+        expected_return,
+        volatility,
+        income_volatility,
+        seed,
+    )
+
+
 @router.patch("/{goal_id}", response_model=GoalResponse)
 async def update_goal(
     goal_id: str,
     goal_data: GoalUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    goal = db.query(Goal).filter(
-        Goal.id == goal_id,
-        Goal.user_id == current_user.id
-    ).first()
+    goal = await update_one(
+        db,
+        Goal,
+        [Goal.id == goal_id, Goal.user_id == current_user.id],
+        goal_data.model_dump(exclude_unset=True)
+    )
     
     if not goal:
         raise HTTPException(
@@ -58,12 +165,7 @@ async def update_goal(
             detail="Goal not found"
         )
     
-    update_data = goal_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(goal, field, value)
-    
-    db.commit()
-    db.refresh(goal)
+    await db.commit()
     
     return goal
 
@@ -71,21 +173,20 @@ async def update_goal(
 @router.delete("/{goal_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_goal(
     goal_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    goal = db.query(Goal).filter(
+    deleted = await delete_returning(db, Goal, [
         Goal.id == goal_id,
         Goal.user_id == current_user.id
-    ).first()
+    ])
     
-    if not goal:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Goal not found"
         )
     
-    db.delete(goal)
-    db.commit()
+    await db.commit()
     
     return None
@@ -1,12 +1,24 @@
-
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional
+from datetime import date
 import uuid
 
-from ..core.database import get_db
-from ..models.models import User, Income
-from ..schemas.schemas import IncomeCreate, IncomeResponse
+from ..core.database import get_async_db
+from ..models.models import Income
+from ..schemas.schemas import (
+    BatchDeleteRequest,
+    BatchDeleteResult,
+    IncomeCreate,
+    IncomeBatchResult,
+    IncomeResponse,
+)
+from ..services.batch import check_batch_size, reject_if_atomic, validate_batch
+from ..services.repository import delete_returning, insert_many, insert_one
+from ..utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page
+from ..utils.serialization import response_columns, rows_response
+from ..services.user_context import CurrentUser
 from .auth import get_current_user
 
 router = APIRouter(prefix="/income", tags=["Income"])
@@ -14,50 +26,112 @@ router = APIRouter(prefix="/income", tags=["Income"])
 
 @router.get("/", response_model=List[IncomeResponse])
 async def get_incomes(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    source: Optional[str] = None,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    incomes = db.query(Income).filter(Income.user_id == current_user.id).all()
-    return incomes
+    columns = response_columns(Income, IncomeResponse)
+    stmt = select(*columns).where(Income.user_id == current_user.id)
+
+    if start_date:
+        stmt = stmt.where(Income.date >= start_date)
+    if end_date:
+        stmt = stmt.where(Income.date <= end_date)
+    if source:
+        stmt = stmt.where(Income.source == source)
+
+    rows, next_cursor = await keyset_page(db, stmt, Income.date, Income.id, cursor, limit)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+
+    return rows_response(rows, columns, headers)
 
 
 @router.post("/", response_model=IncomeResponse, status_code=status.HTTP_201_CREATED)
 async def create_income(
     income_data: IncomeCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    new_income = Income(
-        id=str(uuid.uuid4()),
-        user_id=current_user.id,
+    new_income = await insert_one(db, Income, {
+        "id": str(uuid.uuid4()),
+        "user_id": current_user.id,
         **income_data.model_dump()
-    )
-    
-    db.add(new_income)
-    db.commit()
-    db.refresh(new_income)
+    })
+    await db.commit()
     
     return new_income
 
 
+@router.post("/batch", response_model=IncomeBatchResult, status_code=status.HTTP_201_CREATED)
+async def create_incomes_batch(
+    items: List[Dict[str, Any]] = Body(...),
+    atomic: bool = False,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    valid, errors = validate_batch(items, IncomeCreate)
+    reject_if_atomic(atomic, errors)
+
+    created = []
+    if valid:
+        rows = [
+            {"id": str(uuid.uuid4()), "user_id": current_user.id, **item.model_dump()}
+            for _, item in valid
+        ]
+        # One multi-row INSERT ... RETURNING for the whole batch
+        created = await insert_many(db, Income, rows)
+        await db.commit()
+
+    return {"created": created, "errors": errors}
+
+
+@router.delete("/batch", response_model=BatchDeleteResult)
+async def delete_incomes_batch(
+    request: BatchDeleteRequest,
+    atomic: bool = False,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    check_batch_size(len(request.ids))
+    ids = list(dict.fromkeys(request.ids))
+    deleted = set(await delete_returning(
+        db, Income, [Income.user_id == current_user.id, Income.id.in_(ids)]
+    ))
+    not_found = [income_id for income_id in ids if income_id not in deleted]
+
+    if atomic and not_found:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"not_found": not_found}
+        )
+
+    await db.commit()
+
+    return {"deleted": [income_id for income_id in ids if income_id in deleted], "not_found": not_found}
+
+
 @router.delete("/{income_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_income(
     income_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    income = db.query(Income).filter(
+    deleted = await delete_returning(db, Income, [
         Income.id == income_id,
         Income.user_id == current_user.id
-    ).first()
+    ])
     
-    if not income:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Income not found"
         )
     
-    db.delete(income)
-    db.commit()
+    await db.commit()
     
     return None
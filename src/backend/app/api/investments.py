@@ -0,0 +1,138 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date
+import uuid
+
+from ..core.database import get_async_db
+from ..models.models import Investment, InvestmentType
+from ..schemas.schemas import (
+    Holding,
+    InvestmentCreate,
+    InvestmentResponse,
+    InvestmentUpdate,
+    PortfolioReturnsSummary,
+)
+from ..services.portfolio import holdings, refresh_user_returns
+from ..services.repository import delete_returning, insert_one, update_one
+from ..services.user_context import CurrentUser
+from ..utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page
+from ..utils.serialization import response_columns, rows_response
+from .auth import get_current_user
+
+router = APIRouter(prefix="/investments", tags=["Investments"])
+
+
+@router.get("/", response_model=List[InvestmentResponse])
+async def get_investments(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    fund_name: Optional[str] = None,
+    type: Optional[InvestmentType] = None,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    columns = response_columns(Investment, InvestmentResponse)
+    stmt = select(*columns).where(Investment.user_id == current_user.id)
+
+    if start_date:
+        stmt = stmt.where(Investment.date >= start_date)
+    if end_date:
+        stmt = stmt.where(Investment.date <= end_date)
+    if fund_name:
+        stmt = stmt.where(Investment.fund_name == fund_name)
+    if type:
+        stmt = stmt.where(Investment.type == type)
+
+    rows, next_cursor = await keyset_page(db, stmt, Investment.date, Investment.id, cursor, limit)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+
+    return rows_response(rows, columns, headers)
+
+
+@router.get("/holdings", response_model=List[Holding])
+async def get_holdings(
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await holdings(db, current_user.id)
+
+
+@router.post("/returns", response_model=PortfolioReturnsSummary)
+async def refresh_investment_returns(
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    # Revalues the user's holdings from the NAV store and stores current_value / returns
+    result = await refresh_user_returns(db, current_user.id)
+    await db.commit()
+
+    return result.portfolios.get(
+        current_user.id, {"invested": 0.0, "current_value": 0.0, "xirr": None}
+    )
+
+
+@router.post("/", response_model=InvestmentResponse, status_code=status.HTTP_201_CREATED)
+async def create_investment(
+    investment_data: InvestmentCreate,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    new_investment = await insert_one(db, Investment, {
+        "id": str(uuid.uuid4()),
+        "user_id": current_user.id,
+        **investment_data.model_dump()
+    })
+    await db.commit()
+
+    return new_investment
+
+
+@router.patch("/{investment_id}", response_model=InvestmentResponse)
+async def update_investment(
+    investment_id: str,
+    investment_data: InvestmentUpdate,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    investment = await update_one(
+        db,
+        Investment,
+        [Investment.id == investment_id, Investment.user_id == current_user.id],
+        investment_data.model_dump(exclude_unset=True)
+    )
+
+    if not investment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Investment not found"
+        )
+
+    await db.commit()
+
+    return investment
+
+
+@router.delete("/{investment_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_investment(
+    investment_id: str,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    deleted = await delete_returning(db, Investment, [
+        Investment.id == investment_id,
+        Investment.user_id == current_user.id
+    ])
+
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Investment not found"
+        )
+
+    await db.commit()
+
+    return None
@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from datetime import date
+from typing import Optional
+
+from ..schemas.schemas import NAVReturns, NAVSeries
+from ..services.nav_store import nav_store
+from ..services.user_context import CurrentUser
+from .auth import get_current_user
+
+router = APIRouter(prefix="/nav", tags=["NAV"])
+
+
+def nav_not_found(fund: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"No NAV history for {fund}"
+    )
+
+
+@router.get("/series", response_model=NAVSeries)
+async def get_nav_series(
+    fund: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    rows = nav_store.range(fund, start_date, end_date)
+    if rows is None:
+        raise nav_not_found(fund)
+
+    # Column arrays rather than one object per day
+    return ORJSONResponse({
+        "fund": fund,
+        "dates": rows["date"].astype(str).tolist(),
+        "nav": rows["nav"].tolist(),
+    })
+
+
+@router.get("/returns", response_model=NAVReturns)
+async def get_nav_returns(
+    fund: str,
+    as_of: Optional[date] = None,
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    result = nav_store.trailing_returns(fund, as_of)
+    if result is None:
+        raise nav_not_found(fund)
+
+    return {"fund": fund, **result}
@@ -1,21 +1,23 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..core.database import get_db
-from ..models.models import User, UserProfile
+from ..core.database import get_async_db
+from ..models.models import UserProfile
 from ..schemas.schemas import UserProfileCreate, UserProfileUpdate, UserProfileResponse
-from .auth import get_current_user
+from ..services.repository import insert_one, update_one
+from ..services.user_context import CurrentUser, UserContext, invalidate_user
+from .auth import get_current_context, get_current_user
 
 router = APIRouter(prefix="/profiles", tags=["Profiles"])
 
 
 @router.get("/me", response_model=UserProfileResponse)
 async def get_my_profile(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    context: UserContext = Depends(get_current_context)
 ):
-    profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+    profile = context.profile
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -27,13 +29,15 @@ async def get_my_profile(
 @router.post("/", response_model=UserProfileResponse, status_code=status.HTTP_201_CREATED)
 async def create_profile(
     profile_data: UserProfileCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     # Check if profile already exists
-    existing_profile = db.query(UserProfile).filter(
-        UserProfile.user_id == current_user.id
-    ).first()
+    existing_profile = await db.scalar(
+        select(UserProfile).where(
+            UserProfile.user_id == current_user.id
+        )
+    )
     
     if existing_profile:
         raise HTTPException(
@@ -41,14 +45,12 @@ async def create_profile(
             detail="Profile already exists"
         )
     
-    new_profile = UserProfile(
-        user_id=current_user.id,
+    new_profile = await insert_one(db, UserProfile, {
+        "user_id": current_user.id,
         **profile_data.model_dump(exclude={"user_id"})
-    )
-    
-    db.add(new_profile)
-    db.commit()
-    db.refresh(new_profile)
+    })
+    await db.commit()
+    invalidate_user(current_user.id)
     
     return new_profile
 
@@ -56,10 +58,15 @@ async def create_profile(
 @router.patch("/me", response_model=UserProfileResponse)
 async def update_my_profile(
     profile_data: UserProfileUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+    profile = await update_one(
+        db,
+        UserProfile,
+        [UserProfile.user_id == current_user.id],
+        profile_data.model_dump(exclude_unset=True)
+    )
     
     if not profile:
         raise HTTPException(
@@ -67,11 +74,7 @@ async def update_my_profile(
             detail="Profile not found"
         )
     
-    update_data = profile_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(profile, field, value)
-    
-    db.commit()
-    db.refresh(profile)
+    await db.commit()
+    invalidate_user(current_user.id)
     
     return profile
@@ -0,0 +1,44 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.database import get_async_db
+from ..schemas.schemas import FinancialReport
+from ..services.reports import monthly_report, parse_month
+from ..services.user_context import UserContext
+from .auth import get_current_context
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+
+@router.get("/monthly/{month}", response_model=FinancialReport)
+async def get_monthly_report(
+    month: str,
+    context: UserContext = Depends(get_current_context),
+    db: AsyncSession = Depends(get_async_db)
+):
+    try:
+        period = parse_month(month)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Month must be in YYYY-MM format"
+        )
+
+    if period > date.today():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Reports are not available for future months"
+        )
+
+    if not context.profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+
+    report = await monthly_report(db, context.user.id, period, context.profile)
+    await db.commit()
+
+    return report
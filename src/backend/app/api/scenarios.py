@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+
+from ..schemas.schemas import ScenarioGrid, ScenarioGridResult
+from ..services.scenarios import AXES, MAX_SCENARIOS, evaluate_scenarios, grid_shape
+from ..services.user_context import UserContext
+from .auth import get_current_context
+
+router = APIRouter(prefix="/scenarios", tags=["Scenarios"])
+
+
+@router.post("/evaluate", response_model=ScenarioGridResult)
+async def evaluate_scenario_grid(
+    grid: ScenarioGrid,
+    context: UserContext = Depends(get_current_context)
+):
+    if not context.profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+
+    axes = grid.model_dump()
+    shape = grid_shape(axes)
+    if 0 in shape:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Every axis needs at least one value: {', '.join(AXES)}"
+        )
+
+    count = 1
+    for size in shape:
+        count *= size
+    if count > MAX_SCENARIOS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {MAX_SCENARIOS} scenarios per grid"
+        )
+
+    return ORJSONResponse(evaluate_scenarios(context.profile, axes))
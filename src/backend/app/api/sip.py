@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 
-from ..core.database import get_db
-from ..models.models import UserProfile
-from ..models.models import ProfileType
-from .auth import get_current_user
+from ..core.database import get_async_db
+from ..models.models import ProfileType, RiskLevel
+from ..schemas.schemas import SIPProjection, SIPProjectionRequest, SIPSchemeResponse
+from ..services.sip_catalog import SIPCatalog, sip_catalog
+from ..services.sip_projection import MAX_GRID_AXIS, project_sip
+from ..services.sip_service import suggest_sips
+from ..services.user_context import UserContext
+from .auth import get_current_context
 
 router = APIRouter(
     prefix="/sip",
@@ -12,15 +18,53 @@ router = APIRouter(
 )
 
 
+async def get_sip_catalog(db: AsyncSession = Depends(get_async_db)) -> SIPCatalog:
+    # Only touches the database when the in-memory index is stale
+    await sip_catalog.ensure_fresh(db)
+    return sip_catalog
+
+
+@router.get("/schemes", response_model=List[SIPSchemeResponse])
+async def list_sip_schemes(
+    suitable_for: ProfileType,
+    min_amount: float = Query(0, ge=0),
+    max_amount: Optional[float] = Query(None, ge=0),
+    risk_level: Optional[List[RiskLevel]] = Query(None),
+    catalog: SIPCatalog = Depends(get_sip_catalog)
+):
+    high = max_amount if max_amount is not None else float("inf")
+    return catalog.match(suitable_for, min_amount, high, risk_level)
+
+
+@router.post("/projection", response_model=SIPProjection)
+async def sip_projection(request: SIPProjectionRequest):
+    if not request.annual_rates or not request.horizons_years:
+        raise HTTPException(
+            status_code=422,
+            detail="annual_rates and horizons_years need at least one value"
+        )
+    if len(request.annual_rates) > MAX_GRID_AXIS or len(request.horizons_years) > MAX_GRID_AXIS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {MAX_GRID_AXIS} rates and {MAX_GRID_AXIS} horizons"
+        )
+
+    return ORJSONResponse(project_sip(
+        request.monthly_amount,
+        request.annual_rates,
+        request.horizons_years,
+        request.step_up,
+        request.inflation,
+    ))
+
+
 @router.get("/recommendation")
-def sip_recommendation(
-    db: Session = Depends(get_db),
-    current_user=Depends(get_current_user)
+async def sip_recommendation(
+    context: UserContext = Depends(get_current_context),
+    catalog: SIPCatalog = Depends(get_sip_catalog)
 ):
-    # 1️⃣ Get user profile
-    profile = db.query(UserProfile).filter(
-        UserProfile.user_id == current_user.id
-    ).first()
+    # 1️⃣ Get user profile (loaded together with the user)
+    profile = context.profile
 
     if not profile:
         raise HTTPException(
@@ -44,7 +88,8 @@ def sip_recommendation(
             "monthly_money": monthly_money,
             "recommended_sip": sip_amount,
             "risk_level": "Low",
-            "message": f"Based on your pocket money, you can safely invest ₹{sip_amount}/month in SIP."
+            "message": f"Based on your pocket money, you can safely invest ₹{sip_amount}/month in SIP.",
+            "schemes": suggest_sips(profile, catalog)
         }
 
     # 3️⃣ EMPLOYEE logic
@@ -63,7 +108,8 @@ def sip_recommendation(
             "monthly_money": monthly_money,
             "recommended_sip": sip_amount,
             "risk_level": "Moderate",
-            "message": f"Based on your salary, you can safely invest ₹{sip_amount}/month in SIP."
+            "message": f"Based on your salary, you can safely invest ₹{sip_amount}/month in SIP.",
+            "schemes": suggest_sips(profile, catalog)
         }
 
     raise HTTPException(
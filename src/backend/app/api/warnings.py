@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from ..core.database import get_async_db
+from ..models.models import SmartWarning
+from ..schemas.schemas import SmartWarningResponse
+from ..services.user_context import CurrentUser
+from ..utils.serialization import response_columns, rows_response
+from .auth import get_current_user
+
+router = APIRouter(prefix="/warnings", tags=["Warnings"])
+
+
+@router.get("/", response_model=List[SmartWarningResponse])
+async def get_warnings(
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    # Precomputed by evaluate_warnings.py; this is a primary-key range read
+    columns = response_columns(SmartWarning, SmartWarningResponse)
+    rows = (await db.execute(
+        select(*columns).where(SmartWarning.user_id == current_user.id).order_by(SmartWarning.id)
+    )).all()
+    return rows_response(rows, columns)
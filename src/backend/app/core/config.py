@@ -1,17 +1,49 @@
 
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List, Optional
 
 
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    # Optional override for the asyncio driver URL used by the API routers.
+    # Derived from DATABASE_URL (asyncpg / aiosqlite) when not set.
+    ASYNC_DATABASE_URL: Optional[str] = None
     
     # JWT
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+
+    # Password hashing pool (bcrypt runs off the event loop)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 1
+
+    # Authenticated user cache (token sub -> user snapshot)
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+
+    # In-memory SIP scheme index; reloaded after this long to pick up other writers
+    SIP_CATALOG_TTL_SECONDS: int = 300
+
+    # Memory-mapped NAV history, one .npy per fund (see ingest_nav.py)
+    NAV_DATA_DIR: str = "data/nav"
+
+    # Comma-separated emails allowed to read /admin endpoints
+    ADMIN_EMAILS: str = ""
+
+    # Query profiler (slow-query log, N+1 detection, per-request query budget)
+    QUERY_PROFILER_ENABLED: bool = False
+    SLOW_QUERY_MS: float = 200
+    REPEATED_QUERY_THRESHOLD: int = 5
+    # Statements per request; 0 disables. QUERY_BUDGETS overrides it per route,
+    # keyed "METHOD /path/{template}" (JSON in the environment)
+    QUERY_BUDGET: int = 0
+    QUERY_BUDGETS: Dict[str, int] = {}
+    # Raise instead of logging when a budget is exceeded; for tests only
+    QUERY_BUDGET_STRICT: bool = False
     
     # CORS
     FRONTEND_URL: str = "http://localhost:3000"
@@ -0,0 +1,181 @@
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; the usual Prometheus client defaults
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_string(names: Sequence[str], values: Sequence[str]) -> str:
+    return ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+
+
+class _Family:
+    """Labelled metric: one child metric per tuple of label values.
+
+    ``labels()`` looks a child up (creating it once); hot paths should keep
+    the child instead of calling ``labels()`` per event.
+    """
+
+    def _init_family(self, labelnames: Sequence[str]):
+        self.labelnames = tuple(labelnames)
+        self.label_string = ""
+        self._children: Dict[Tuple[str, ...], "_Family"] = {}
+        self._family_lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        child = self._children.get(values)
+        if child is None:
+            with self._family_lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._new_child()
+                    child.label_string = _label_string(self.labelnames, values)
+                    self._children[values] = child
+        return child
+
+    def _members(self) -> list:
+        return list(self._children.values()) if self.labelnames else [self]
+
+
+class Counter(_Family):
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.value = 0.0
+        self._lock = threading.Lock()
+        self._init_family(labelnames)
+
+    def _new_child(self):
+        return Counter(self.name, self.documentation)
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def collect(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} counter",
+        ]
+        for member in self._members():
+            labels = f"{{{member.label_string}}}" if member.label_string else ""
+            lines.append(f"{self.name}{labels} {member.value}")
+        return lines
+
+
+class Gauge:
+    """A gauge that is either set directly or read from a callback at scrape time."""
+
+    def __init__(self, name: str, documentation: str, func: Optional[Callable[[], float]] = None):
+        self.name = name
+        self.documentation = documentation
+        self.value = 0.0
+        self._func = func
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        with self._lock:
+            self.value -= amount
+
+    def collect(self) -> List[str]:
+        value = self._func() if self._func else self.value
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {value}",
+        ]
+
+
+class Histogram(_Family):
+    """Cumulative-bucket histogram; observing is one bisect and two additions."""
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float] = DEFAULT_BUCKETS,
+                 labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        # One slot per bucket plus +Inf; made cumulative at scrape time
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+        self._init_family(labelnames)
+
+    def _new_child(self):
+        return Histogram(self.name, self.documentation, self.buckets)
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def collect(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        bounds = [repr(float(bound)) for bound in self.buckets] + ["+Inf"]
+        for member in self._members():
+            with member._lock:
+                counts = list(member.counts)
+                total = member.sum
+            prefix = f"{member.label_string}," if member.label_string else ""
+            labels = f"{{{member.label_string}}}" if member.label_string else ""
+
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{labels} {total}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    return registry.register(Counter(name, documentation, labelnames))
+
+
+def gauge(name: str, documentation: str, func: Optional[Callable[[], float]] = None) -> Gauge:
+    return registry.register(Gauge(name, documentation, func))
+
+
+def histogram(name: str, documentation: str, buckets: Sequence[float] = DEFAULT_BUCKETS,
+              labelnames: Sequence[str] = ()) -> Histogram:
+    return registry.register(Histogram(name, documentation, buckets, labelnames))
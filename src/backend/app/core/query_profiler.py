@@ -0,0 +1,148 @@
+"""Slow-query log, N+1 detection and per-route query budgets.
+
+Off unless ``QUERY_PROFILER_ENABLED`` is set; when off nothing is installed,
+so production pays nothing. The profiler does not time statements itself:
+it observes the per-statement timings and per-request state that
+``request_metrics`` already keeps.
+
+- Statements slower than ``SLOW_QUERY_MS`` are logged with the route that
+  issued them.
+- Statements are reduced to a shape (bound parameters and expanded IN lists
+  collapsed). A shape run ``REPEATED_QUERY_THRESHOLD`` times or more in one
+  request is logged as a likely N+1, e.g. a lazy ``User.goals`` load inside
+  a loop.
+- Routes get a statement budget: ``QUERY_BUDGETS`` per route
+  (``{"GET /goals/{goal_id}": 3}``), else ``QUERY_BUDGET``. Requests over
+  budget are logged. With ``QUERY_BUDGET_STRICT`` (tests only) the statement
+  that crosses the budget raises ``QueryBudgetExceeded``, so the request
+  fails with a traceback pointing at the offending code. ``query_budget``
+  sets an always-strict budget for one route inside a test block.
+"""
+import logging
+import re
+from collections import Counter as ShapeCounter
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from . import metrics
+from .config import settings
+from .request_metrics import RequestDB, request_observers, route_template, statement_observers
+
+logger = logging.getLogger(__name__)
+
+MAX_CACHED_SHAPES = 2048
+OUTSIDE_REQUEST = "-"
+
+_PARAMETER_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|%s|\$\d+|:\w+)(?:\s*,\s*(?:\?|%\(\w+\)s|%s|\$\d+|:\w+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+slow_queries = metrics.counter("db_slow_queries_total", "Statements slower than SLOW_QUERY_MS")
+repeated_queries = metrics.counter("db_repeated_query_requests_total", "Requests repeating one statement shape")
+budget_exceeded = metrics.counter("db_query_budget_exceeded_total", "Requests over their query budget")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+_shapes: Dict[str, str] = {}
+# Budgets set by query_budget(); these always raise
+_strict_budgets: Dict[str, int] = {}
+
+
+def statement_shape(statement: str) -> str:
+    """``statement`` with parameter lists collapsed to ``(?)`` and whitespace normalized."""
+    shape = _shapes.get(statement)
+    if shape is None:
+        shape = _WHITESPACE.sub(" ", _PARAMETER_LIST.sub("(?)", statement)).strip()
+        if len(_shapes) >= MAX_CACHED_SHAPES:
+            _shapes.clear()
+        _shapes[statement] = shape
+    return shape
+
+
+@contextmanager
+def query_budget(route: str, limit: int):
+    """Fail any request to ``route`` ("GET /goals/{goal_id}") issuing more than ``limit`` statements.
+
+    For tests: requests made inside the block raise ``QueryBudgetExceeded``
+    (surfaced by TestClient) regardless of ``QUERY_BUDGET_STRICT``. Needs
+    ``QUERY_PROFILER_ENABLED``.
+    """
+    previous = _strict_budgets.get(route)
+    _strict_budgets[route] = limit
+    try:
+        yield
+    finally:
+        if previous is None:
+            _strict_budgets.pop(route, None)
+        else:
+            _strict_budgets[route] = previous
+
+
+class RequestProfile:
+    """Statement shapes of one request, kept in ``RequestDB.profile``."""
+
+    __slots__ = ("route", "shapes", "budget", "strict")
+
+    def __init__(self, scope):
+        # The router has matched by the time the first statement runs
+        self.route = f"{scope['method']} {route_template(scope)}"
+        self.shapes: ShapeCounter = ShapeCounter()
+        if self.route in _strict_budgets:
+            self.budget, self.strict = _strict_budgets[self.route], True
+        else:
+            self.budget = settings.QUERY_BUDGETS.get(self.route, settings.QUERY_BUDGET)
+            self.strict = settings.QUERY_BUDGET_STRICT
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+def _observe_statement(statement: str, elapsed: float, usage: Optional[RequestDB]):
+    profile = None
+    if usage is not None:
+        profile = usage.profile
+        if profile is None:
+            profile = usage.profile = RequestProfile(usage.scope)
+        profile.shapes[statement_shape(statement)] += 1
+
+        # Raise on the statement that crosses the budget, before the response is sent
+        if profile.strict and profile.budget and usage.queries == profile.budget + 1:
+            budget_exceeded.inc()
+            raise QueryBudgetExceeded(f"{profile.route} exceeded its budget of {profile.budget} queries")
+
+    elapsed_ms = elapsed * 1000
+    if elapsed_ms >= settings.SLOW_QUERY_MS:
+        slow_queries.inc()
+        logger.warning(
+            "Slow query (%.1f ms) on %s: %s",
+            elapsed_ms,
+            profile.route if profile is not None else OUTSIDE_REQUEST,
+            statement_shape(statement),
+        )
+
+
+def _check_request(usage: RequestDB):
+    """Log repeated shapes and budget overruns of a finished request."""
+    profile = usage.profile
+    if profile is None:
+        return
+
+    repeated = profile.repeated(settings.REPEATED_QUERY_THRESHOLD)
+    if repeated:
+        repeated_queries.inc()
+        for shape, count in repeated:
+            logger.warning("Possible N+1 on %s: %d x %s", profile.route, count, shape)
+
+    if profile.budget and usage.queries > profile.budget and not profile.strict:
+        budget_exceeded.inc()
+        logger.warning("%s ran %d queries (budget %d)", profile.route, usage.queries, profile.budget)
+
+
+def install():
+    """Start observing statements and requests when the profiler is enabled."""
+    if not settings.QUERY_PROFILER_ENABLED:
+        return
+    statement_observers.append(_observe_statement)
+    request_observers.append(_check_request)
@@ -0,0 +1,187 @@
+"""Per-route HTTP metrics and per-request database usage.
+
+``RequestMetricsMiddleware`` is plain ASGI, so it adds no extra task or
+response wrapping per request. Routes are labelled by their path template
+(``/goals/{goal_id}``), never by the raw path, which keeps label cardinality
+bounded. The labelled children of each (route, method) are resolved once and
+reused, so a request does not build label dicts or strings.
+
+Statements are counted by cursor events on both engines. A context variable
+set by the middleware ties each statement to the request that issued it;
+SQLAlchemy runs async statements in a greenlet that shares the task's
+context, so this also covers AsyncSession. Other instrumentation (the query
+profiler) hooks in through ``statement_observers`` and ``request_observers``
+instead of timing statements a second time.
+"""
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import event
+
+from . import metrics
+from .database import async_engine, engine
+
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+UNMATCHED_ROUTE = "unmatched"
+OTHER_METHOD = "OTHER"
+STANDARD_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+request_duration = metrics.histogram(
+    "http_request_duration_seconds", "HTTP request latency", labelnames=("route", "method")
+)
+requests_total = metrics.counter(
+    "http_requests_total", "HTTP responses by status code", labelnames=("route", "method", "status")
+)
+requests_in_progress = metrics.gauge("http_requests_in_progress", "HTTP requests being served")
+request_queries = metrics.histogram(
+    "http_request_db_queries", "Database statements per HTTP request",
+    buckets=QUERY_BUCKETS, labelnames=("route", "method"),
+)
+request_db_seconds = metrics.histogram(
+    "http_request_db_seconds", "Database time per HTTP request", labelnames=("route", "method")
+)
+db_queries = metrics.counter("db_queries_total", "Database statements executed")
+db_seconds = metrics.counter("db_query_seconds_total", "Time spent executing database statements")
+
+
+class RequestDB:
+    """Database usage of the request being served.
+
+    ``profile`` is free for an observer to keep its own per-request state.
+    """
+
+    __slots__ = ("scope", "queries", "seconds", "profile")
+
+    def __init__(self, scope):
+        self.scope = scope
+        self.queries = 0
+        self.seconds = 0.0
+        self.profile = None
+
+
+_request_db: ContextVar[Optional[RequestDB]] = ContextVar("request_db", default=None)
+
+
+def current_request_db() -> Optional[RequestDB]:
+    return _request_db.get()
+
+
+# Called as observer(statement, elapsed, usage) after each statement; usage is
+# None outside a request
+statement_observers: List[Callable[[str, float, Optional[RequestDB]], None]] = []
+# Called as observer(usage) when a request has been served
+request_observers: List[Callable[[RequestDB], None]] = []
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_started
+    db_queries.inc()
+    db_seconds.inc(elapsed)
+
+    usage = _request_db.get()
+    if usage is not None:
+        usage.queries += 1
+        usage.seconds += elapsed
+    for observer in statement_observers:
+        observer(statement, elapsed, usage)
+
+
+for _engine in (engine, async_engine.sync_engine):
+    event.listen(_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class _RouteMetrics:
+    """Metric children for one (route, method), resolved on its first request."""
+
+    __slots__ = ("route", "method", "duration", "queries", "db_seconds", "responses")
+
+    def __init__(self, route: str, method: str):
+        self.route = route
+        self.method = method
+        self.duration = request_duration.labels(route, method)
+        self.queries = request_queries.labels(route, method)
+        self.db_seconds = request_db_seconds.labels(route, method)
+        self.responses: Dict[int, metrics.Counter] = {}
+
+    def observe(self, status: int, elapsed: float, usage: RequestDB):
+        self.duration.observe(elapsed)
+        self.queries.observe(usage.queries)
+        self.db_seconds.observe(usage.seconds)
+
+        responses = self.responses.get(status)
+        if responses is None:
+            responses = self.responses[status] = requests_total.labels(self.route, self.method, str(status))
+        responses.inc()
+
+
+def route_template(scope) -> str:
+    """Path template of the route that served ``scope``.
+
+    Newer Starlette records the matched route in the scope; older versions
+    only record its endpoint, which is looked up in the (flat) route list.
+    """
+    route = scope.get("route")
+    if route is not None and hasattr(route, "path"):
+        return route.path
+
+    endpoint = scope.get("endpoint")
+    app = scope.get("app")
+    if endpoint is None or app is None:
+        return UNMATCHED_ROUTE
+    for route in app.routes:
+        if getattr(route, "endpoint", None) is endpoint:
+            return route.path
+    return UNMATCHED_ROUTE
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+        self._routes: Dict[tuple, _RouteMetrics] = {}
+        # Scanners send arbitrary paths and method tokens; all of them share one entry
+        self._unmatched = _RouteMetrics(UNMATCHED_ROUTE, OTHER_METHOD)
+
+    def _route_metrics(self, scope) -> _RouteMetrics:
+        endpoint = scope.get("endpoint")
+        method = scope["method"]
+        if endpoint is None or method not in STANDARD_METHODS:
+            return self._unmatched
+
+        key = (endpoint, method)
+        route = self._routes.get(key)
+        if route is None:
+            route = self._routes[key] = _RouteMetrics(route_template(scope), method)
+        return route
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        usage = RequestDB(scope)
+        token = _request_db.set(usage)
+        requests_in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            requests_in_progress.dec()
+            _request_db.reset(token)
+            self._route_metrics(scope).observe(status, elapsed, usage)
+        for observer in request_observers:
+            observer(usage)
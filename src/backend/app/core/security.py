@@ -1,9 +1,12 @@
-
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from .config import settings
+from . import metrics
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -16,6 +19,72 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password[:72])
 
 
+class PasswordPoolBusy(Exception):
+    """Raised when the password hashing pool has no room for another job."""
+
+
+class PasswordHashPool:
+    """Bounded thread pool that keeps bcrypt work off the event loop.
+
+    At most `max_pending` jobs (running + queued) are admitted; beyond that
+    callers get PasswordPoolBusy immediately instead of waiting in line.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self.pending - self.workers, 0)
+
+    async def run(self, func, *args):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                password_pool_rejected.inc()
+                raise PasswordPoolBusy()
+            self.pending += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+
+password_pool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+password_pool_rejected = metrics.counter(
+    "password_hash_pool_rejected_total",
+    "Password hash/verify jobs rejected because the pool was full",
+)
+metrics.gauge(
+    "password_hash_pool_in_flight",
+    "Password hash/verify jobs running or queued",
+    lambda: password_pool.pending,
+)
+metrics.gauge(
+    "password_hash_pool_queue_depth",
+    "Password hash/verify jobs waiting for a worker",
+    lambda: password_pool.queue_depth,
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_pool.run(get_password_hash, password)
+
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
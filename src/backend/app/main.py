@@ -1,12 +1,21 @@
-from .core.database import engine, Base
+from .core.database import engine, Base, AsyncSessionLocal
+
+import logging
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
+from sqlalchemy.exc import SQLAlchemyError
 from .core.config import settings
-from .api import auth, expenses, income, goals, profiles, sip
+from .core import metrics, query_profiler
+from .core.request_metrics import RequestMetricsMiddleware
+from .services.sip_catalog import sip_catalog
+from .api import auth, expenses, income, goals, profiles, sip, analytics, export, reports, warnings, scenarios, nav, investments, admin
 # ❌ REMOVE this import
 # from app.utils.seed_sips import seed_sip_schemes
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title="FinGenius API",
     description="Backend API for FinGenius Financial Management Platform",
@@ -19,15 +28,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
+app.add_middleware(RequestMetricsMiddleware)
+query_profiler.install()
 
 # Include routers
 app.include_router(auth.router)
 app.include_router(expenses.router)
 app.include_router(income.router)
 app.include_router(goals.router)
+app.include_router(investments.router)
 app.include_router(profiles.router)
 app.include_router(sip.router)
+app.include_router(analytics.router)
+app.include_router(export.router)
+app.include_router(reports.router)
+app.include_router(warnings.router)
+app.include_router(scenarios.router)
+app.include_router(nav.router)
+app.include_router(admin.router)
 
 
 @app.get("/")
@@ -43,6 +63,22 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    return Response(content=metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@app.on_event("startup")
+async def load_sip_catalog():
+    # A fresh database (before `alembic upgrade`) must not stop the app from
+    # booting; the catalog stays stale and loads on first use instead.
+    try:
+        async with AsyncSessionLocal() as db:
+            await sip_catalog.refresh(db)
+    except (SQLAlchemyError, OSError) as exc:
+        logger.warning("SIP catalog not loaded at startup: %s", exc)
+
 # ❌ REMOVE startup seeding completely
 # @app.on_event("startup")
 # def seed_data():
@@ -10,4 +10,8 @@ from .models import (
     InvestmentType,
     RiskLevel,
     SIPScheme,
+    MonthlyRollup,
+    MonthlyReport,
+    SmartWarning,
+    SystemStat,
 )
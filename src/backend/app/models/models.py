@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Float, DateTime, Boolean, ForeignKey, Enum, JSON
+from sqlalchemy import Column, String, Integer, Float, Date, DateTime, Boolean, ForeignKey, Enum, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -78,7 +78,7 @@ class Expense(Base):
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
     amount = Column(Float, nullable=False)
     category = Column(String, nullable=False)
-    date = Column(String, nullable=False)  # ISO date string
+    date = Column(Date, nullable=False)
     type = Column(Enum(ExpenseType), nullable=False)
     description = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -86,6 +86,10 @@ class Expense(Base):
     # Relationship
     user = relationship("User", back_populates="expenses")
 
+    __table_args__ = (
+        Index("ix_expenses_user_id_date_id", "user_id", "date", "id"),
+    )
+
 
 class Income(Base):
     __tablename__ = "incomes"
@@ -94,13 +98,17 @@ class Income(Base):
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
     amount = Column(Float, nullable=False)
     source = Column(String, nullable=False)
-    date = Column(String, nullable=False)
+    date = Column(Date, nullable=False)
     description = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
     # Relationship
     user = relationship("User", back_populates="incomes")
 
+    __table_args__ = (
+        Index("ix_incomes_user_id_date_id", "user_id", "date", "id"),
+    )
+
 
 class Goal(Base):
     __tablename__ = "goals"
@@ -110,7 +118,7 @@ class Goal(Base):
     name = Column(String, nullable=False)
     target_amount = Column(Float, nullable=False)
     saved_amount = Column(Float, default=0, nullable=False)
-    deadline = Column(String, nullable=False)
+    deadline = Column(Date, nullable=False)
     category = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
@@ -126,7 +134,7 @@ class Investment(Base):
     fund_name = Column(String, nullable=False)
     amount = Column(Float, nullable=False)
     type = Column(Enum(InvestmentType), nullable=False)
-    date = Column(String, nullable=False)
+    date = Column(Date, nullable=False)
     current_value = Column(Float, nullable=True)
     returns = Column(Float, nullable=True)
     risk = Column(Enum(RiskLevel), nullable=True)
@@ -134,6 +142,11 @@ class Investment(Base):
     
     # Relationship
     user = relationship("User", back_populates="investments")
+
+    __table_args__ = (
+        Index("ix_investments_user_id_fund_name", "user_id", "fund_name"),
+        Index("ix_investments_user_id_date_id", "user_id", "date", "id"),
+    )
     
 class SIPScheme(Base):
     __tablename__ = "sip_schemes"
@@ -148,3 +161,52 @@ class SIPScheme(Base):
     risk_level = Column(Enum(RiskLevel), nullable=False)
 
     description = Column(String, nullable=True)
+
+
+class MonthlyRollup(Base):
+    """Per-user monthly sums kept in step with every expense/income write."""
+
+    __tablename__ = "monthly_rollups"
+
+    user_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    month = Column(String(7), primary_key=True)  # "YYYY-MM"
+    category = Column(String, primary_key=True)  # expense category or income source
+    type = Column(String, primary_key=True)  # "essential", "non-essential" or "income"
+    total = Column(Float, default=0, nullable=False)
+    count = Column(Integer, default=0, nullable=False)
+
+
+class MonthlyReport(Base):
+    """Cached monthly report payload; closed months are dropped only by writes dated in them."""
+
+    __tablename__ = "monthly_reports"
+
+    user_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    month = Column(String(7), primary_key=True)  # "YYYY-MM"
+    payload = Column(JSON, nullable=False)
+    closed = Column(Boolean, default=False, nullable=False)
+    generated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class SmartWarning(Base):
+    """Warnings from the last batch evaluation (see app/services/warnings.py)."""
+
+    __tablename__ = "smart_warnings"
+
+    user_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    id = Column(String, primary_key=True)  # rule id, e.g. "trend-spike"
+    type = Column(String, nullable=False)  # "warning" or "danger"
+    title = Column(String, nullable=False)
+    message = Column(String, nullable=False)
+    icon = Column(String, nullable=False)
+    date = Column(DateTime, nullable=False)
+
+
+class SystemStat(Base):
+    """Sharded running totals for the admin dashboard (see app/services/admin_stats.py)."""
+
+    __tablename__ = "system_stats"
+
+    name = Column(String, primary_key=True)
+    shard = Column(Integer, primary_key=True)
+    value = Column(Float, default=0, nullable=False)
@@ -1,6 +1,8 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional, Dict
-from datetime import datetime
+from pydantic import BaseModel, EmailStr, Field, confloat, conint
+from typing import Any, Optional, Dict, List
+from datetime import date, datetime
+# For fields named `date`, where the field name shadows the type inside the class body
+from datetime import date as Date
 from enum import Enum
 
 
@@ -48,6 +50,21 @@ class TokenData(BaseModel):
     user_id: Optional[str] = None
 
 
+# Batch Schemas
+class BatchItemError(BaseModel):
+    index: int
+    errors: List[Dict[str, Any]]
+
+
+class BatchDeleteRequest(BaseModel):
+    ids: List[str]
+
+
+class BatchDeleteResult(BaseModel):
+    deleted: List[str]
+    not_found: List[str]
+
+
 # User Schemas
 class UserBase(BaseModel):
     email: EmailStr
@@ -113,7 +130,7 @@ class UserProfileResponse(UserProfileBase):
 class ExpenseBase(BaseModel):
     amount: float
     category: str
-    date: str
+    date: date
     type: ExpenseType
     description: str
 
@@ -131,11 +148,30 @@ class ExpenseResponse(ExpenseBase):
         from_attributes = True
 
 
+class ImportRowError(BaseModel):
+    row: int
+    detail: str
+
+
+class ExpenseImportSummary(BaseModel):
+    imported: int
+    skipped: int
+    total_amount: float
+    essential_count: int
+    non_essential_count: int
+    errors: List[ImportRowError] = []
+
+
+class ExpenseBatchResult(BaseModel):
+    created: List[ExpenseResponse]
+    errors: List[BatchItemError] = []
+
+
 # Income Schemas
 class IncomeBase(BaseModel):
     amount: float
     source: str
-    date: str
+    date: date
     description: str
 
 
@@ -152,12 +188,17 @@ class IncomeResponse(IncomeBase):
         from_attributes = True
 
 
+class IncomeBatchResult(BaseModel):
+    created: List[IncomeResponse]
+    errors: List[BatchItemError] = []
+
+
 # Goal Schemas
 class GoalBase(BaseModel):
     name: str
     target_amount: float
     saved_amount: float = 0
-    deadline: str
+    deadline: date
     category: str
 
 
@@ -169,7 +210,7 @@ class GoalUpdate(BaseModel):
     name: Optional[str] = None
     target_amount: Optional[float] = None
     saved_amount: Optional[float] = None
-    deadline: Optional[str] = None
+    deadline: Optional[date] = None
     category: Optional[str] = None
 
 
@@ -182,12 +223,161 @@ class GoalResponse(GoalBase):
         from_attributes = True
 
 
+class GoalBatchResult(BaseModel):
+    created: List[GoalResponse]
+    errors: List[BatchItemError] = []
+
+
+class CompletionPercentile(BaseModel):
+    percentile: int
+    # None when fewer paths than the percentile reach the target in the horizon
+    months: Optional[int]
+    date: Optional[date]
+
+
+class GoalSimulation(BaseModel):
+    seed: int
+    paths: int
+    horizon_months: int
+    months_to_deadline: float
+    probability_by_deadline: float
+    probability_within_horizon: float
+    completion: List[CompletionPercentile]
+    deterministic_months: int
+
+
+# SIP Schemas
+class SIPSchemeResponse(BaseModel):
+    id: int
+    name: str
+    min_amount: float
+    max_amount: float
+    suitable_for: ProfileType
+    risk_level: RiskLevel
+    description: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class SIPProjectionRequest(BaseModel):
+    # Bounded so every grid cell stays finite (no inf/NaN in the heatmap)
+    monthly_amount: float = Field(..., gt=0, le=1e9)
+    # Annual fractions: 0.12 is 12% a year
+    annual_rates: List[confloat(gt=-1, le=1)]
+    horizons_years: List[conint(ge=1, le=50)]
+    step_up: float = Field(0.0, gt=-1, le=1)
+    inflation: float = Field(0.06, gt=-1, le=1)
+
+
+class SIPProjection(BaseModel):
+    annual_rates: List[float]
+    horizons_years: List[int]
+    total_invested: List[float]
+    future_value: List[List[float]]
+    real_value: List[List[float]]
+
+
+# NAV Schemas
+class NAVSeries(BaseModel):
+    fund: str
+    dates: List[date]
+    nav: List[float]
+
+
+class NAVReturns(BaseModel):
+    fund: str
+    as_of: date
+    nav: float
+    # "1y", "3y", "5y" CAGR; None when the history is shorter
+    returns: Dict[str, Optional[float]]
+
+
+# Scenario Schemas
+class ScenarioGrid(BaseModel):
+    """Values to try per parameter; every combination is one scenario."""
+    income_change: List[float] = [0.0]
+    new_monthly_expense: List[float] = [0.0]
+    new_loan_emi: List[float] = [0.0]
+    sip_step_up: List[float] = [0.0]
+    one_time_expense: List[float] = [0.0]
+
+
+class ScenarioBaseline(BaseModel):
+    income: float
+    outflow: float
+    investable: float
+
+
+class ScenarioGridResult(BaseModel):
+    axes: Dict[str, List[float]]
+    shape: List[int]
+    baseline: ScenarioBaseline
+    columns: List[str]
+    outcomes: List[List[Optional[float]]]
+
+
+# Analytics Schemas
+class SummaryTotals(BaseModel):
+    expenses: float
+    essential: float
+    non_essential: float
+    income: float
+    net: float
+    expense_count: int
+    income_count: int
+
+
+class MonthlySummary(BaseModel):
+    month: str
+    expenses: float
+    essential: float
+    non_essential: float
+    income: float
+    net: float
+
+
+class CategoryTotal(BaseModel):
+    name: str
+    value: float
+    count: int
+
+
+class AnalyticsSummary(BaseModel):
+    totals: SummaryTotals
+    monthly: List[MonthlySummary]
+    categories: List[CategoryTotal]
+
+
+class FinancialReport(BaseModel):
+    period: str
+    month: str
+    year: int
+    total_income: float
+    total_expenses: float
+    savings_rate: float
+    top_expense_category: str
+    goal_progress: float
+    score: int
+    insights: List[str]
+    closed: bool
+
+
+class SmartWarningResponse(BaseModel):
+    id: str
+    type: str
+    title: str
+    message: str
+    date: datetime
+    icon: str
+
+
 # Investment Schemas
 class InvestmentBase(BaseModel):
     fund_name: str
     amount: float
     type: InvestmentType
-    date: str
+    date: date
     current_value: Optional[float] = None
     returns: Optional[float] = None
     risk: Optional[RiskLevel] = None
@@ -197,10 +387,64 @@ class InvestmentCreate(InvestmentBase):
     pass
 
 
+class InvestmentUpdate(BaseModel):
+    fund_name: Optional[str] = None
+    amount: Optional[float] = None
+    type: Optional[InvestmentType] = None
+    date: Optional[Date] = None
+    current_value: Optional[float] = None
+    returns: Optional[float] = None
+    risk: Optional[RiskLevel] = None
+
+
 class InvestmentResponse(InvestmentBase):
     id: str
     user_id: str
     created_at: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class Holding(BaseModel):
+    fund_name: str
+    type: InvestmentType
+    count: int
+    invested: float
+    current_value: float
+    # Absolute gain (current_value - invested); InvestmentResponse.returns is an XIRR %
+    gain: float
+    returns_pct: Optional[float] = None
+    # Invested amount per risk level ("Low", "Moderate", "High", "Unrated")
+    risk_mix: Dict[str, float]
+
+
+class PortfolioReturnsSummary(BaseModel):
+    invested: float
+    current_value: float
+    xirr: Optional[float] = None
+
+
+
+# Admin Schemas
+class SystemAlert(BaseModel):
+    id: str
+    severity: str
+    title: str
+    message: str
+    action: Optional[str] = None
+    created_at: datetime
+
+
+class AdminStats(BaseModel):
+    total_users: int
+    new_users_24h: int
+    total_profiles: int
+    total_expenses: float
+    total_transactions: int
+    total_investments: float
+    investment_count: int
+    total_goals: int
+    total_goals_saved: float
+    avg_goal_completion: int
+    alerts: List[SystemAlert]
\ No newline at end of file
@@ -0,0 +1,235 @@
+"""Running totals for the admin dashboard.
+
+Port of ``calculateSystemStats`` (utils/adminAnalytics.ts) without the table
+scans: repository listeners add each write's contribution to system_stats in
+the writing transaction, so the totals are exact and reading them touches a
+fixed number of rows. Every total is split over ``STAT_SHARDS`` rows, and a
+transaction adds to one random shard, so concurrent writers rarely wait on
+the same row lock. Signups are also counted per hour; hourly buckets older
+than the 24-hour window are deleted, so the table stays a bounded set of rows.
+"""
+import random
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..models.models import Expense, Goal, Investment, SystemStat, User, UserProfile
+from .repository import WriteListener, listen, upsert
+
+STAT_SHARDS = 16
+SIGNUP_BUCKET_PREFIX = "users_created:"
+SIGNUP_WINDOW_HOURS = 24
+TOTALS = (
+    "users",
+    "profiles",
+    "expenses",
+    "expense_amount",
+    "goals",
+    "goal_saved",
+    "goal_completion",
+    "investments",
+    "investment_amount",
+)
+
+
+def signup_bucket(created_at: datetime) -> str:
+    return SIGNUP_BUCKET_PREFIX + created_at.strftime("%Y-%m-%dT%H")
+
+
+def _user_stats(row: dict) -> Dict[str, float]:
+    stats = {"users": 1}
+    # Buckets outside the window are never read and may already be pruned
+    if row["created_at"] >= datetime.utcnow() - timedelta(hours=SIGNUP_WINDOW_HOURS):
+        stats[signup_bucket(row["created_at"])] = 1
+    return stats
+
+
+def _profile_stats(row: dict) -> Dict[str, float]:
+    return {"profiles": 1}
+
+
+def _expense_stats(row: dict) -> Dict[str, float]:
+    return {"expenses": 1, "expense_amount": row["amount"]}
+
+
+def _goal_stats(row: dict) -> Dict[str, float]:
+    saved = row.get("saved_amount") or 0
+    target = row["target_amount"]
+    return {
+        "goals": 1,
+        "goal_saved": saved,
+        "goal_completion": saved / target * 100 if target else 0,
+    }
+
+
+def _investment_stats(row: dict) -> Dict[str, float]:
+    return {"investments": 1, "investment_amount": row["amount"]}
+
+
+async def apply_stat_deltas(db: AsyncSession, deltas: Dict[str, float]):
+    deltas = {name: value for name, value in deltas.items() if value}
+    if not deltas:
+        return
+
+    shard = random.randrange(STAT_SHARDS)
+    stmt = upsert(db, SystemStat)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name", "shard"],
+        set_={"value": SystemStat.value + stmt.excluded.value},
+    )
+    # Sorted names give concurrent transactions the same lock order
+    await db.execute(stmt, [
+        {"name": name, "shard": shard, "value": deltas[name]} for name in sorted(deltas)
+    ])
+
+
+class StatsListener(WriteListener):
+    """Adds ``contributions(row)`` on insert, subtracts it on delete.
+
+    With ``needs_previous``, updates subtract the row's previous contribution
+    and add the new one; without it, updates are assumed not to change the
+    contribution and are ignored (saving update_one the extra SELECT).
+    """
+
+    def __init__(self, contributions: Callable[[dict], Dict[str, float]], columns: Sequence[str] = (),
+                 needs_previous: bool = False):
+        self.contributions = contributions
+        self.columns = tuple(columns)
+        self.needs_previous = needs_previous
+
+    def _deltas(self, rows: Iterable[dict], sign: int, deltas: Optional[dict] = None) -> dict:
+        deltas = deltas if deltas is not None else defaultdict(float)
+        for row in rows:
+            for name, value in self.contributions(row).items():
+                deltas[name] += sign * value
+        return deltas
+
+    async def inserted(self, db, model, rows):
+        await apply_stat_deltas(db, self._deltas(rows, 1))
+
+    async def updated(self, db, model, rows, previous=None):
+        if not self.needs_previous:
+            return
+        await apply_stat_deltas(db, self._deltas(previous or [], -1, self._deltas(rows, 1)))
+
+    async def deleted(self, db, model, rows):
+        await apply_stat_deltas(db, self._deltas(rows, -1))
+
+
+def _recent_buckets(now: datetime) -> List[str]:
+    return [signup_bucket(now - timedelta(hours=hours)) for hours in range(SIGNUP_WINDOW_HOURS)]
+
+
+def _expired_buckets(now: datetime):
+    oldest = _recent_buckets(now)[-1]
+    # Bucket names sort chronologically
+    return delete(SystemStat).where(
+        SystemStat.name.startswith(SIGNUP_BUCKET_PREFIX),
+        SystemStat.name < oldest,
+    )
+
+
+class SignupStatsListener(StatsListener):
+    """User totals; the first signup of each hour (per process) also prunes expired buckets."""
+
+    def __init__(self):
+        super().__init__(_user_stats, ["created_at"])
+        self._pruned_bucket: Optional[str] = None
+
+    async def inserted(self, db, model, rows):
+        await super().inserted(db, model, rows)
+        now = datetime.utcnow()
+        bucket = signup_bucket(now)
+        if bucket != self._pruned_bucket:
+            await db.execute(_expired_buckets(now))
+            self._pruned_bucket = bucket
+
+
+listen(User, SignupStatsListener())
+listen(UserProfile, StatsListener(_profile_stats))
+listen(Expense, StatsListener(_expense_stats, ["amount"]))
+listen(Goal, StatsListener(_goal_stats, ["saved_amount", "target_amount"], needs_previous=True))
+listen(Investment, StatsListener(_investment_stats, ["amount"], needs_previous=True))
+
+
+async def read_stats(db: AsyncSession, now: Optional[datetime] = None) -> Dict[str, float]:
+    """Every total plus ``new_users_24h``; one grouped read over a fixed set of rows."""
+    now = now or datetime.utcnow()
+    buckets = _recent_buckets(now)
+    rows = (await db.execute(
+        select(SystemStat.name, func.sum(SystemStat.value))
+        .where(SystemStat.name.in_(list(TOTALS) + buckets))
+        .group_by(SystemStat.name)
+    )).all()
+    values = dict(rows)
+
+    stats = {name: values.get(name, 0.0) for name in TOTALS}
+    stats["new_users_24h"] = sum(values.get(bucket, 0.0) for bucket in buckets)
+    return stats
+
+
+def system_alerts(stats: Dict[str, float], now: datetime) -> List[dict]:
+    """The alerts of ``generateSystemAlerts`` that the running totals can answer."""
+    alerts = []
+    created_at = now.isoformat()
+
+    new_users = int(stats["new_users_24h"])
+    if new_users > 0:
+        alerts.append({
+            "id": f"alert-newusers-{int(now.timestamp() * 1000)}",
+            "severity": "info",
+            "title": "New User Registrations",
+            "message": f"{new_users} new user{'s' if new_users > 1 else ''} registered in the last 24 hours.",
+            "action": "View Users",
+            "created_at": created_at,
+        })
+
+    incomplete = int(stats["users"] - stats["profiles"])
+    if stats["users"] > 0 and incomplete > 0:
+        alerts.append({
+            "id": f"alert-profiles-{int(now.timestamp() * 1000)}",
+            "severity": "warning",
+            "title": "Incomplete User Profiles",
+            "message": (
+                f"{incomplete} user{'s have' if incomplete > 1 else ' has'} incomplete profile data. "
+                "This may affect personalization features."
+            ),
+            "action": "Review Profiles",
+            "created_at": created_at,
+        })
+
+    return alerts
+
+
+def rebuild_stats(db: Session, now: Optional[datetime] = None):
+    """Recompute system_stats from the base tables (drift repair)."""
+    now = now or datetime.utcnow()
+    db.execute(delete(SystemStat))
+
+    completion = func.coalesce(func.sum(
+        func.coalesce(Goal.saved_amount * 100.0 / func.nullif(Goal.target_amount, 0), 0)
+    ), 0)
+    totals = {
+        "users": select(func.count()).select_from(User),
+        "profiles": select(func.count()).select_from(UserProfile),
+        "expenses": select(func.count()).select_from(Expense),
+        "expense_amount": select(func.coalesce(func.sum(Expense.amount), 0)),
+        "goals": select(func.count()).select_from(Goal),
+        "goal_saved": select(func.coalesce(func.sum(Goal.saved_amount), 0)),
+        "goal_completion": select(completion),
+        "investments": select(func.count()).select_from(Investment),
+        "investment_amount": select(func.coalesce(func.sum(Investment.amount), 0)),
+    }
+    rows = [{"name": name, "shard": 0, "value": db.scalar(stmt)} for name, stmt in totals.items()]
+
+    since = now - timedelta(hours=SIGNUP_WINDOW_HOURS)
+    buckets = defaultdict(int)
+    for created_at in db.scalars(select(User.created_at).where(User.created_at >= since)):
+        buckets[signup_bucket(created_at)] += 1
+    rows.extend({"name": name, "shard": 0, "value": count} for name, count in buckets.items())
+
+    db.execute(insert(SystemStat), rows)
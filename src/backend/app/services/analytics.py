@@ -0,0 +1,136 @@
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.models import Expense, ExpenseType, Income, MonthlyRollup
+from ..utils.dates import month_of
+from .rollups import INCOME_TYPE
+
+
+def _date_window(stmt, column, start_date: Optional[date], end_date: Optional[date]):
+    # Plain range predicates on the DATE column keep the (user_id, date, id) index usable
+    if start_date:
+        stmt = stmt.where(column >= start_date)
+    if end_date:
+        stmt = stmt.where(column <= end_date)
+    return stmt
+
+
+def _whole_months(start_date: Optional[date], end_date: Optional[date]) -> bool:
+    if start_date and start_date.day != 1:
+        return False
+    if end_date and (end_date + timedelta(days=1)).day != 1:
+        return False
+    return True
+
+
+def _rollup_window(stmt, start_date: Optional[date], end_date: Optional[date]):
+    if start_date:
+        stmt = stmt.where(MonthlyRollup.month >= start_date.strftime("%Y-%m"))
+    if end_date:
+        stmt = stmt.where(MonthlyRollup.month <= end_date.strftime("%Y-%m"))
+    return stmt
+
+
+async def expense_groups(db: AsyncSession, user_id: str, start_date=None, end_date=None):
+    """(month, category, type, total, count) per group.
+
+    Whole-month windows read the precomputed rollups, so the cost depends on
+    months x categories rather than on how many expenses the user has.
+    Windows that cut through a month aggregate the base table instead.
+    """
+    if _whole_months(start_date, end_date):
+        stmt = select(
+            MonthlyRollup.month,
+            MonthlyRollup.category,
+            MonthlyRollup.type,
+            MonthlyRollup.total,
+            MonthlyRollup.count,
+        ).where(MonthlyRollup.user_id == user_id, MonthlyRollup.type != INCOME_TYPE)
+        return (await db.execute(_rollup_window(stmt, start_date, end_date))).all()
+
+    month = month_of(Expense.date, db.get_bind().dialect.name)
+    stmt = select(
+        month,
+        Expense.category,
+        Expense.type,
+        func.sum(Expense.amount),
+        func.count(),
+    ).where(Expense.user_id == user_id)
+    stmt = _date_window(stmt, Expense.date, start_date, end_date)
+    stmt = stmt.group_by(month, Expense.category, Expense.type)
+    return (await db.execute(stmt)).all()
+
+
+async def income_groups(db: AsyncSession, user_id: str, start_date=None, end_date=None):
+    """(month, source, total, count) per group, from rollups when the window allows."""
+    if _whole_months(start_date, end_date):
+        stmt = select(
+            MonthlyRollup.month,
+            MonthlyRollup.category,
+            MonthlyRollup.total,
+            MonthlyRollup.count,
+        ).where(MonthlyRollup.user_id == user_id, MonthlyRollup.type == INCOME_TYPE)
+        return (await db.execute(_rollup_window(stmt, start_date, end_date))).all()
+
+    month = month_of(Income.date, db.get_bind().dialect.name)
+    stmt = select(
+        month,
+        Income.source,
+        func.sum(Income.amount),
+        func.count(),
+    ).where(Income.user_id == user_id)
+    stmt = _date_window(stmt, Income.date, start_date, end_date)
+    stmt = stmt.group_by(month, Income.source)
+    return (await db.execute(stmt)).all()
+
+
+def monthly_summary(expense_rows, income_rows) -> list:
+    months = defaultdict(lambda: {"expenses": 0.0, "essential": 0.0, "non_essential": 0.0, "income": 0.0})
+
+    for month, _category, expense_type, total, _count in expense_rows:
+        bucket = months[month]
+        bucket["expenses"] += total
+        if expense_type == ExpenseType.ESSENTIAL:
+            bucket["essential"] += total
+        else:
+            bucket["non_essential"] += total
+
+    for month, _source, total, _count in income_rows:
+        months[month]["income"] += total
+
+    return [
+        {"month": month, **values, "net": values["income"] - values["expenses"]}
+        for month, values in sorted(months.items())
+    ]
+
+
+def category_summary(expense_rows) -> list:
+    categories = defaultdict(lambda: [0.0, 0])
+    for _month, category, _type, total, count in expense_rows:
+        categories[category][0] += total
+        categories[category][1] += count
+
+    return sorted(
+        ({"name": name, "value": value, "count": count} for name, (value, count) in categories.items()),
+        key=lambda item: item["value"],
+        reverse=True,
+    )
+
+
+def totals_summary(expense_rows, income_rows) -> dict:
+    essential = sum(row[3] for row in expense_rows if row[2] == ExpenseType.ESSENTIAL)
+    expenses = sum(row[3] for row in expense_rows)
+    income = sum(row[2] for row in income_rows)
+    return {
+        "expenses": expenses,
+        "essential": essential,
+        "non_essential": expenses - essential,
+        "income": income,
+        "net": income - expenses,
+        "expense_count": sum(row[4] for row in expense_rows),
+        "income_count": sum(row[3] for row in income_rows),
+    }
@@ -0,0 +1,46 @@
+from typing import Any, Dict, List, Tuple, Type
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ValidationError
+
+MAX_BATCH_SIZE = 1000
+
+
+def check_batch_size(count: int):
+    if count > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {MAX_BATCH_SIZE} items per batch"
+        )
+
+
+def validate_batch(items: List[Dict[str, Any]], schema: Type[BaseModel]) -> Tuple[list, list]:
+    """Validate each item on its own.
+
+    Returns ``(valid, errors)`` where ``valid`` holds ``(index, model)`` pairs and
+    ``errors`` holds ``{"index", "errors"}`` dicts for the items that failed.
+    """
+    check_batch_size(len(items))
+
+    valid = []
+    errors = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, schema.model_validate(item)))
+        except ValidationError as e:
+            errors.append({
+                "index": index,
+                "errors": [
+                    {"loc": list(err["loc"]), "msg": err["msg"], "type": err["type"]}
+                    for err in e.errors()
+                ],
+            })
+    return valid, errors
+
+
+def reject_if_atomic(atomic: bool, errors: list):
+    if atomic and errors:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=errors
+        )
@@ -0,0 +1,166 @@
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from typing import AsyncIterator, List
+
+from sqlalchemy import Boolean, Date, DateTime, Enum, Float, Integer, select
+
+from ..core.database import AsyncSessionLocal
+from ..models.models import Expense, Goal, Income, Investment
+
+EXPORT_CHUNK_SIZE = 2000
+
+# dataset name -> (model, ordering attribute)
+DATASETS = {
+    "expenses": (Expense, Expense.date),
+    "incomes": (Income, Income.date),
+    "goals": (Goal, Goal.deadline),
+    "investments": (Investment, Investment.date),
+}
+
+
+class ExportFormat(str, enum.Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+    PARQUET = "parquet"
+
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+
+def export_columns(model) -> list:
+    return [column for column in model.__table__.columns if column.key != "user_id"]
+
+
+def _plain(value):
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+async def _partitions(model, order_by, user_id: str) -> AsyncIterator[List[tuple]]:
+    """Yield the user's rows in chunks through a server-side cursor.
+
+    Opens its own session so the cursor outlives the request handler.
+    """
+    columns = export_columns(model)
+    stmt = (
+        select(*columns)
+        .where(model.user_id == user_id)
+        .order_by(order_by, model.id)
+        .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+    )
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(stmt)
+        async for partition in result.partitions():
+            yield partition
+
+
+async def stream_csv(model, order_by, user_id: str) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([column.key for column in export_columns(model)])
+
+    async for rows in _partitions(model, order_by, user_id):
+        writer.writerows([_plain(value) for value in row] for row in rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def stream_ndjson(model, order_by, user_id: str) -> AsyncIterator[bytes]:
+    keys = [column.key for column in export_columns(model)]
+
+    async for rows in _partitions(model, order_by, user_id):
+        lines = [json.dumps(dict(zip(keys, (_plain(value) for value in row)))) for row in rows]
+        yield ("\n".join(lines) + "\n").encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands written bytes back in chunks.
+
+    It tracks the absolute position so the Parquet footer offsets stay right
+    even though earlier bytes have already been sent.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_schema(pa, model):
+    def arrow_type(column_type):
+        if isinstance(column_type, Enum):
+            return pa.string()
+        if isinstance(column_type, DateTime):
+            return pa.timestamp("us")
+        if isinstance(column_type, Date):
+            return pa.date32()
+        if isinstance(column_type, Boolean):
+            return pa.bool_()
+        if isinstance(column_type, Integer):
+            return pa.int64()
+        if isinstance(column_type, Float):
+            return pa.float64()
+        return pa.string()
+
+    return pa.schema([(column.key, arrow_type(column.type)) for column in export_columns(model)])
+
+
+async def stream_parquet(model, order_by, user_id: str) -> AsyncIterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema(pa, model)
+    enum_positions = [
+        index for index, column in enumerate(export_columns(model)) if isinstance(column.type, Enum)
+    ]
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+
+    try:
+        # One row group per partition keeps memory bounded by EXPORT_CHUNK_SIZE
+        async for rows in _partitions(model, order_by, user_id):
+            columns = [list(values) for values in zip(*rows)]
+            for index in enum_positions:
+                columns[index] = [_plain(value) for value in columns[index]]
+            writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+
+    yield sink.drain()
+
+
+STREAMERS = {
+    ExportFormat.CSV: stream_csv,
+    ExportFormat.NDJSON: stream_ndjson,
+    ExportFormat.PARQUET: stream_parquet,
+}
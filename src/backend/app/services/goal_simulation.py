@@ -0,0 +1,142 @@
+"""Monte Carlo feasibility for a savings goal.
+
+Replaces the deterministic ``target / contribution`` estimate of
+``calculateGoalFeasibility`` (utils/financialIntelligence.ts) with many
+simulated paths of market returns and contribution shocks.
+"""
+import calendar
+import math
+import secrets
+from datetime import date
+from typing import Optional
+
+import numpy as np
+
+DAYS_PER_MONTH = 30
+PERCENTILES = (10, 25, 50, 75, 90)
+# Months drawn per block; paths that reached the target drop out between blocks
+BLOCK_MONTHS = 60
+
+
+def add_months(value: date, months: int) -> date:
+    month_index = value.month - 1 + months
+    year, month = value.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, min(value.day, calendar.monthrange(year, month)[1]))
+
+
+def months_until(deadline: date, today: date) -> float:
+    # Same 30-day months as the client's feasibility check
+    return (deadline - today).days / DAYS_PER_MONTH
+
+
+def completion_months(
+    target: float,
+    saved: float,
+    contribution: float,
+    months: int,
+    paths: int,
+    annual_return: float,
+    annual_volatility: float,
+    income_volatility: float,
+    seed: int,
+) -> np.ndarray:
+    """Month (1-based) in which each path first reaches ``target``; inf if never.
+
+    Each month the balance grows by a normal monthly return and then receives
+    the contribution scaled by a normal income shock (floored at zero). Draws
+    are float32, in (month, path) blocks so each step reads contiguous rows.
+    """
+    completion = np.full(paths, np.inf)
+    if saved >= target:
+        completion[:] = 0
+        return completion
+
+    rng = np.random.default_rng(seed)
+    mu = np.float32(annual_return / 12)
+    sigma = np.float32(annual_volatility / math.sqrt(12))
+    income_sigma = np.float32(income_volatility)
+
+    balance = np.full(paths, saved, dtype=np.float64)
+    active = np.arange(paths)
+
+    for start in range(0, months, BLOCK_MONTHS):
+        block = min(BLOCK_MONTHS, months - start)
+        width = active.size
+
+        growth = rng.standard_normal((block, width), dtype=np.float32)
+        growth *= sigma
+        growth += 1 + mu
+        if income_sigma:
+            income = rng.standard_normal((block, width), dtype=np.float32)
+            income *= income_sigma
+            income += 1
+            np.maximum(income, 0, out=income)
+            income *= np.float32(contribution)
+        else:
+            income = np.full((block, width), contribution, dtype=np.float32)
+
+        current = balance[active]
+        reached = np.zeros(width, dtype=bool)
+        for step in range(block):
+            current = current * growth[step] + income[step]
+            hit = (current >= target) & ~reached
+            completion[active[hit]] = start + step + 1
+            reached |= hit
+
+        balance[active] = current
+        active = active[~reached]
+        if not active.size:
+            break
+
+    return completion
+
+
+def simulate_goal(
+    target: float,
+    saved: float,
+    deadline: date,
+    contribution: float,
+    months: int,
+    paths: int,
+    annual_return: float,
+    annual_volatility: float,
+    income_volatility: float,
+    seed: Optional[int] = None,
+    today: Optional[date] = None,
+) -> dict:
+    """Probability of meeting the deadline and percentile bands of the completion date.
+
+    Without a seed one is drawn and returned, so any run can be replayed.
+    """
+    today = today or date.today()
+    if seed is None:
+        seed = secrets.randbits(32)
+
+    completion = completion_months(
+        target, saved, contribution, months, paths,
+        annual_return, annual_volatility, income_volatility, seed,
+    )
+    deadline_months = months_until(deadline, today)
+
+    # inverted_cdf picks actual samples, so unreached (inf) percentiles stay inf
+    quantiles = np.quantile(completion, [p / 100 for p in PERCENTILES], method="inverted_cdf")
+    bands = []
+    for percentile, value in zip(PERCENTILES, quantiles):
+        reached = bool(np.isfinite(value))
+        bands.append({
+            "percentile": percentile,
+            "months": int(value) if reached else None,
+            "date": add_months(today, int(value)) if reached else None,
+        })
+
+    remaining = target - saved
+    return {
+        "seed": seed,
+        "paths": paths,
+        "horizon_months": months,
+        "months_to_deadline": deadline_months,
+        "probability_by_deadline": float(np.mean(completion <= deadline_months)),
+        "probability_within_horizon": float(np.mean(np.isfinite(completion))),
+        "completion": bands,
+        "deterministic_months": math.ceil(remaining / contribution) if remaining > 0 else 0,
+    }
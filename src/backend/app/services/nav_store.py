@@ -0,0 +1,161 @@
+"""Daily NAV history stored as one memory-mapped .npy file per fund.
+
+Each file holds a date-sorted structured array of ``(date, nav)``. Opening a
+series maps the file without reading it, and lookups binary-search the date
+column, so a query touches a handful of pages however long the history is.
+Files are keyed by a slug of the fund name, which is how both
+``SIPScheme.name`` and ``Investment.fund_name`` find their series.
+"""
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from ..core.config import settings
+
+NAV_DTYPE = np.dtype([("date", "datetime64[D]"), ("nav", "float64")])
+TRAILING_YEARS = (1, 3, 5)
+
+
+def series_key(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def _years_before(day: date, years: int) -> date:
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        # 29 February
+        return day.replace(year=day.year - years, day=28)
+
+
+class NAVStore:
+    """Opened series are kept in a small LRU of memmaps.
+
+    A cached map is reopened when its file's mtime changes, so an ingest in
+    another process (which replaces the file atomically) is picked up.
+    """
+
+    def __init__(self, root, max_open: int = 1024):
+        self.root = Path(root)
+        self.max_open = max_open
+        self._open: "OrderedDict[str, Tuple[int, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def path(self, name: str) -> Path:
+        return self.root / f"{series_key(name)}.npy"
+
+    def series(self, name: str) -> Optional[np.ndarray]:
+        path = self.path(name)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        key = path.name
+        with self._lock:
+            entry = self._open.get(key)
+            if entry is not None and entry[0] == mtime:
+                self._open.move_to_end(key)
+                return entry[1]
+
+        array = np.load(path, mmap_mode="r")
+        with self._lock:
+            self._open[key] = (mtime, array)
+            self._open.move_to_end(key)
+            while len(self._open) > self.max_open:
+                self._open.popitem(last=False)
+        return array
+
+    def range(self, name: str, start: Optional[date] = None, end: Optional[date] = None) -> Optional[np.ndarray]:
+        """Rows with ``start <= date <= end`` as a view into the map."""
+        series = self.series(name)
+        if series is None:
+            return None
+        dates = series["date"]
+        lo = np.searchsorted(dates, np.datetime64(start, "D"), side="left") if start else 0
+        hi = np.searchsorted(dates, np.datetime64(end, "D"), side="right") if end else len(series)
+        return series[lo:hi]
+
+    @staticmethod
+    def _on_or_before(series: np.ndarray, day: date) -> Optional[int]:
+        position = int(np.searchsorted(series["date"], np.datetime64(day, "D"), side="right")) - 1
+        return position if position >= 0 else None
+
+    def nav_on(self, name: str, day: date) -> Optional[Tuple[date, float]]:
+        """Latest NAV published on or before ``day``."""
+        series = self.series(name)
+        if series is None:
+            return None
+        position = self._on_or_before(series, day)
+        if position is None:
+            return None
+        row = series[position]
+        return row["date"].item(), float(row["nav"])
+
+    def navs_on(self, name: str, days) -> Optional[np.ndarray]:
+        """Vectorized ``nav_on``: NAV on or before each day, NaN before the history starts."""
+        series = self.series(name)
+        if series is None:
+            return None
+        positions = np.searchsorted(series["date"], np.asarray(days, dtype="datetime64[D]"), side="right") - 1
+        navs = np.full(positions.shape, np.nan)
+        found = positions >= 0
+        navs[found] = series["nav"][positions[found]]
+        return navs
+
+    def trailing_returns(self, name: str, as_of: Optional[date] = None) -> Optional[dict]:
+        """CAGR over ``TRAILING_YEARS`` ending at ``as_of`` (default: the last NAV).
+
+        A horizon is None when the history does not reach back that far.
+        """
+        series = self.series(name)
+        if series is None or not len(series):
+            return None
+
+        end = len(series) - 1 if as_of is None else self._on_or_before(series, as_of)
+        if end is None:
+            return None
+        end_date = series[end]["date"].item()
+        end_nav = float(series[end]["nav"])
+
+        returns: Dict[str, Optional[float]] = {}
+        for years in TRAILING_YEARS:
+            start = self._on_or_before(series, _years_before(end_date, years))
+            start_nav = float(series[start]["nav"]) if start is not None else 0.0
+            returns[f"{years}y"] = (end_nav / start_nav) ** (1 / years) - 1 if start_nav > 0 else None
+
+        return {"as_of": end_date, "nav": end_nav, "returns": returns}
+
+    def write(self, name: str, rows: Iterable[Tuple[date, float]]) -> int:
+        """Merge ``(date, nav)`` rows into a fund's file; new values win on equal dates.
+
+        The file is written next to the old one and swapped in with os.replace,
+        so readers see either the old or the new series, never a partial one.
+        """
+        incoming = np.array([(np.datetime64(day, "D"), nav) for day, nav in rows], dtype=NAV_DTYPE)
+        existing = self.series(name)
+        if existing is not None:
+            incoming = np.concatenate([incoming, np.asarray(existing)])
+
+        # Stable sort keeps the incoming row first among equal dates
+        incoming = incoming[np.argsort(incoming["date"], kind="stable")]
+        keep = np.ones(len(incoming), dtype=bool)
+        keep[1:] = incoming["date"][1:] != incoming["date"][:-1]
+        merged = incoming[keep]
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path(name)
+        partial = path.with_suffix(".npy.tmp")
+        with open(partial, "wb") as handle:
+            np.save(handle, merged)
+        os.replace(partial, path)
+        return len(merged)
+
+
+nav_store = NAVStore(settings.NAV_DATA_DIR)
@@ -0,0 +1,237 @@
+"""Current value and XIRR for Investment rows, per holding and per portfolio.
+
+Each Investment row is one dated purchase. Its current value is the units
+bought (amount / NAV on the purchase date) at the latest NAV from the NAV
+store; rows whose fund has no NAV history keep their stored current_value.
+XIRR is solved for every holding and every user's portfolio at once: all
+cash flows sit in flat arrays tagged with a problem number and the solver
+iterates on all problems together, summing per problem with bincount.
+"""
+import math
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import Float, case, cast, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..models.models import Investment, RiskLevel
+from .nav_store import NAVStore, nav_store
+
+DAYS_PER_YEAR = 365.0
+RATE_BOUNDS = (-0.99, 10.0)
+UPDATE_CHUNK_SIZE = 1000
+UNRATED = "Unrated"
+
+
+def xirr(groups: np.ndarray, amounts: np.ndarray, years: np.ndarray, count: int,
+         tol: float = 1e-10, max_iter: int = 100) -> np.ndarray:
+    """Annual rate per group solving ``sum(amount * (1 + r) ** years) == 0``.
+
+    ``years`` is how long before the valuation date each flow happened.
+    Newton steps on x = log(1 + r) are kept inside a per-group bracket and
+    replaced by bisection when they leave it. Groups without a sign change
+    over ``RATE_BOUNDS`` get NaN.
+    """
+    def npv(x):
+        growth = np.exp(x[groups] * years)
+        value = np.bincount(groups, weights=amounts * growth, minlength=count)
+        slope = np.bincount(groups, weights=amounts * years * growth, minlength=count)
+        return value, slope
+
+    x_lo = np.full(count, math.log1p(RATE_BOUNDS[0]))
+    x_hi = np.full(count, math.log1p(RATE_BOUNDS[1]))
+    f_lo, _ = npv(x_lo)
+    f_hi, _ = npv(x_hi)
+    solvable = np.sign(f_lo) * np.sign(f_hi) < 0
+
+    x = np.full(count, math.log1p(0.1))
+    active = solvable.copy()
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        value, slope = npv(x)
+
+        # x_lo keeps the sign of f_lo, so the root stays between x_lo and x_hi
+        with_lo = np.sign(value) == np.sign(f_lo)
+        x_lo = np.where(with_lo, x, x_lo)
+        x_hi = np.where(with_lo, x_hi, x)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = x - value / slope
+        inside = np.isfinite(step) & (step > x_lo) & (step < x_hi)
+        new_x = np.where(inside, step, (x_lo + x_hi) / 2)
+
+        converged = np.abs(new_x - x) < tol
+        x = np.where(active, new_x, x)
+        active &= ~converged
+
+    return np.where(solvable, np.expm1(x), np.nan)
+
+
+def _floats(values: Sequence) -> np.ndarray:
+    return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+
+
+def current_values(funds: Sequence[str], dates: Sequence[date], amounts: np.ndarray,
+                   stored: np.ndarray, as_of: date, store: NAVStore) -> np.ndarray:
+    """amount / NAV(purchase date) * NAV(as_of) per row; ``stored`` where there is no NAV."""
+    values = stored.copy()
+    names, fund_index = np.unique(np.asarray(funds, dtype=object), return_inverse=True)
+    purchase_days = np.asarray(dates, dtype="datetime64[D]")
+
+    for position, name in enumerate(names):
+        rows = np.flatnonzero(fund_index == position)
+        latest = store.navs_on(name, [as_of])
+        if latest is None or not latest[0] > 0:
+            continue
+        bought_at = store.navs_on(name, purchase_days[rows])
+        priced = bought_at > 0
+        values[rows[priced]] = amounts[rows[priced]] / bought_at[priced] * latest[0]
+    return values
+
+
+class PortfolioReturns:
+    """Per-row and per-user results of one valuation run."""
+
+    def __init__(self, ids: List[str], values: np.ndarray, rates: np.ndarray, portfolios: Dict[str, dict]):
+        self.ids = ids
+        self.values = values
+        self.rates = rates
+        self.portfolios = portfolios
+
+    def updates(self) -> Iterator[tuple]:
+        """(id, current_value, returns %) for rows that could be valued."""
+        for row_id, value, rate in zip(self.ids, self.values.tolist(), self.rates.tolist()):
+            if value == value:
+                yield row_id, round(value, 2), round(rate * 100, 2) if rate == rate else None
+
+
+def compute_returns(rows: Sequence, as_of: date, store: NAVStore = nav_store) -> PortfolioReturns:
+    """Value ``(id, user_id, fund_name, amount, date, current_value)`` rows and solve XIRR.
+
+    Holdings are problems ``0..n-1`` and portfolios ``n..n+u-1``; each row
+    adds its purchase and its current value as flows to both.
+    """
+    ids, user_ids, funds, amounts, dates, stored = (list(column) for column in zip(*rows)) if rows else ([],) * 6
+    n = len(ids)
+    amounts = np.asarray(amounts, dtype=np.float64)
+    values = current_values(funds, dates, amounts, _floats(stored), as_of, store)
+
+    users, user_index = np.unique(np.asarray(user_ids, dtype=object), return_inverse=True)
+    valued = np.flatnonzero(np.isfinite(values))
+    held_years = (np.datetime64(as_of, "D") - np.asarray(dates, dtype="datetime64[D]")).astype(np.float64) / DAYS_PER_YEAR
+
+    holding = valued
+    portfolio = n + user_index[valued]
+    groups = np.concatenate([holding, holding, portfolio, portfolio])
+    flows = np.concatenate([-amounts[valued], values[valued], -amounts[valued], values[valued]])
+    years = np.concatenate([held_years[valued], np.zeros(len(valued)), held_years[valued], np.zeros(len(valued))])
+
+    rates = xirr(groups.astype(np.int64), flows, years, n + len(users))
+
+    invested = np.bincount(user_index[valued], weights=amounts[valued], minlength=len(users))
+    worth = np.bincount(user_index[valued], weights=values[valued], minlength=len(users))
+    portfolios = {}
+    for position, user_id in enumerate(users.tolist()):
+        rate = rates[n + position]
+        portfolios[user_id] = {
+            "invested": float(invested[position]),
+            "current_value": float(worth[position]),
+            "xirr": float(rate) if rate == rate else None,
+        }
+
+    return PortfolioReturns(ids, values, rates[:n], portfolios)
+
+
+def _rows_statement(user_id: Optional[str]):
+    stmt = select(
+        Investment.id,
+        Investment.user_id,
+        Investment.fund_name,
+        Investment.amount,
+        Investment.date,
+        Investment.current_value,
+    )
+    if user_id:
+        stmt = stmt.where(Investment.user_id == user_id)
+    return stmt
+
+
+def _update_statements(updates: List[tuple]) -> Iterator:
+    """One UPDATE ... SET col = CASE id WHEN ... per chunk of rows, not one per row."""
+    for start in range(0, len(updates), UPDATE_CHUNK_SIZE):
+        chunk = updates[start:start + UPDATE_CHUNK_SIZE]
+        ids = [row_id for row_id, _value, _rate in chunk]
+        yield (
+            update(Investment)
+            .where(Investment.id.in_(ids))
+            .values(
+                # cast: an all-NULL CASE (e.g. every holding too new for XIRR) is untyped,
+                # which PostgreSQL resolves to text
+                current_value=cast(case({row_id: value for row_id, value, _rate in chunk}, value=Investment.id), Float),
+                returns=cast(case({row_id: rate for row_id, _value, rate in chunk}, value=Investment.id), Float),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+
+def refresh_returns(db: Session, user_id: Optional[str] = None, as_of: Optional[date] = None) -> PortfolioReturns:
+    """Batch job: revalue every investment (or one user's) and write the results back."""
+    rows = db.execute(_rows_statement(user_id)).all()
+    result = compute_returns(rows, as_of or date.today())
+    for stmt in _update_statements(list(result.updates())):
+        db.execute(stmt)
+    return result
+
+
+async def refresh_user_returns(db: AsyncSession, user_id: str, as_of: Optional[date] = None) -> PortfolioReturns:
+    rows = (await db.execute(_rows_statement(user_id))).all()
+    result = compute_returns(rows, as_of or date.today())
+    for stmt in _update_statements(list(result.updates())):
+        await db.execute(stmt)
+    return result
+
+
+async def holdings(db: AsyncSession, user_id: str) -> List[dict]:
+    """Investments grouped by (fund_name, type), aggregated in one query.
+
+    Rows without a computed current_value count at their invested amount.
+    """
+    value = func.coalesce(Investment.current_value, Investment.amount)
+    risk_amounts = [
+        func.sum(case((Investment.risk == level, Investment.amount), else_=0))
+        for level in RiskLevel
+    ]
+    unrated_amount = func.sum(case((Investment.risk.is_(None), Investment.amount), else_=0))
+    invested = func.sum(Investment.amount)
+
+    stmt = (
+        select(
+            Investment.fund_name,
+            Investment.type,
+            func.count(),
+            invested,
+            func.sum(value),
+            *risk_amounts,
+            unrated_amount,
+        )
+        .where(Investment.user_id == user_id)
+        .group_by(Investment.fund_name, Investment.type)
+        .order_by(invested.desc())
+    )
+
+    result = []
+    for fund_name, kind, count, total, worth, *mix in (await db.execute(stmt)).all():
+        result.append({
+            "fund_name": fund_name,
+            "type": kind,
+            "count": count,
+            "invested": total,
+            "current_value": worth,
+            "gain": worth - total,
+            "returns_pct": (worth - total) / total * 100 if total else None,
+            "risk_mix": dict(zip([level.value for level in RiskLevel] + [UNRATED], mix)),
+        })
+    return result
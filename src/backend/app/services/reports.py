@@ -0,0 +1,185 @@
+import calendar
+import re
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Iterable, List, Optional
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.models import Expense, Goal, MonthlyReport, MonthlyRollup, ProfileType, UserProfile
+from .repository import WriteListener, listen, upsert
+from .rollups import INCOME_TYPE
+
+_MONTH = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
+
+
+def parse_month(text: str) -> date:
+    """First day of a "YYYY-MM" month; ValueError for anything else."""
+    if not _MONTH.match(text):
+        raise ValueError(f"Invalid month: {text}")
+    return date(int(text[:4]), int(text[5:]), 1)
+
+
+def month_key(value: date) -> str:
+    return value.strftime("%Y-%m")
+
+
+def profile_income(profile) -> float:
+    # Same rule as the client report: students get 4 weeks of pocket money
+    if profile is None:
+        return 0.0
+    if profile.type == ProfileType.STUDENT:
+        return (profile.weekly_pocket_money or 0) * 4
+    return profile.monthly_income or 0.0
+
+
+def build_report(period: date, category_totals: dict, goals: Iterable[tuple], profile) -> dict:
+    """Port of ``generateMonthlyReport`` (utils/financialIntelligence.ts).
+
+    ``category_totals`` maps expense category to the month's total and
+    ``goals`` yields ``(target_amount, saved_amount)`` pairs.
+    """
+    total_expenses = sum(category_totals.values())
+    income = profile_income(profile)
+    savings = max(0.0, income - total_expenses)
+    savings_rate = savings / income * 100 if income > 0 else 0.0
+
+    top_category = max(category_totals, key=category_totals.get) if category_totals else "None"
+
+    active = [(target, saved) for target, saved in goals if saved < target]
+    if active:
+        goal_progress = sum(saved / target for target, saved in active if target) / len(active) * 100
+    else:
+        goal_progress = 100.0
+
+    score = 50
+    if savings_rate > 20:
+        score += 20
+    if savings_rate > 40:
+        score += 10
+    if total_expenses < income * 0.8:
+        score += 10
+    if goal_progress > 10:
+        score += 10
+
+    insights = [
+        "Great savings rate this month!" if savings_rate > 20 else "Try to boost your savings next month.",
+        f"Your biggest expense was {top_category}.",
+        "You're making steady progress on goals." if goal_progress > 0 else "Time to start funding your goals!",
+    ]
+
+    return {
+        "period": month_key(period),
+        "month": calendar.month_name[period.month],
+        "year": period.year,
+        "total_income": income,
+        "total_expenses": total_expenses,
+        "savings_rate": savings_rate,
+        "top_expense_category": top_category,
+        "goal_progress": goal_progress,
+        "score": min(score, 100),
+        "insights": insights,
+    }
+
+
+async def _compute(db: AsyncSession, user_id: str, period: date, profile) -> dict:
+    rows = (await db.execute(
+        select(MonthlyRollup.category, MonthlyRollup.total).where(
+            MonthlyRollup.user_id == user_id,
+            MonthlyRollup.month == month_key(period),
+            MonthlyRollup.type != INCOME_TYPE,
+        )
+    )).all()
+    category_totals = defaultdict(float)
+    for category, total in rows:
+        # essential and non-essential rollups of one category add up
+        category_totals[category] += total
+
+    goals = (await db.execute(
+        select(Goal.target_amount, Goal.saved_amount).where(Goal.user_id == user_id)
+    )).all()
+    return build_report(period, category_totals, goals, profile)
+
+
+async def monthly_report(db: AsyncSession, user_id: str, period: date, profile, today: Optional[date] = None) -> dict:
+    """Cached report for ``period``.
+
+    Reports for months before the current one are stored as closed and
+    served as-is until a write dated in that month (a backdated expense, an
+    import of an old statement) drops them. The current month's report is
+    also dropped by goal and profile writes.
+    """
+    current = (today or date.today()).replace(day=1)
+    key = month_key(period)
+
+    cached = await db.get(MonthlyReport, (user_id, key))
+    if cached is not None and (cached.closed or period == current):
+        return {**cached.payload, "closed": cached.closed}
+
+    payload = await _compute(db, user_id, period, profile)
+    closed = period < current
+
+    stmt = upsert(db, MonthlyReport).values(
+        user_id=user_id, month=key, payload=payload, closed=closed, generated_at=datetime.utcnow()
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "month"],
+        set_={"payload": stmt.excluded.payload, "closed": stmt.excluded.closed, "generated_at": stmt.excluded.generated_at},
+        where=MonthlyReport.closed.is_(False),
+    )
+    await db.execute(stmt)
+    return {**payload, "closed": closed}
+
+
+async def invalidate_open_reports(db: AsyncSession, user_ids: Iterable[str]):
+    """Drop the users' cached reports that are still open; closed months are left alone."""
+    await db.execute(
+        delete(MonthlyReport).where(MonthlyReport.closed.is_(False), MonthlyReport.user_id.in_(set(user_ids)))
+    )
+
+
+async def invalidate_month_reports(db: AsyncSession, user_ids: Iterable[str], months: Iterable[str]):
+    """Drop cached reports, open or closed, for the given (user_id, month) pairs."""
+    await db.execute(
+        delete(MonthlyReport).where(
+            tuple_(MonthlyReport.user_id, MonthlyReport.month).in_(set(zip(user_ids, months)))
+        )
+    )
+
+
+class ReportInvalidator(WriteListener):
+    """Drops cached reports affected by a write.
+
+    With ``date_key`` the reports of the written rows' months are dropped,
+    closed ones included, since their totals change; an update also drops
+    the month a row moved out of. Otherwise (goals, profiles) every open
+    report of the user is dropped and closed months keep their snapshot.
+    """
+
+    def __init__(self, date_key: Optional[str] = None):
+        self.date_key = date_key
+        self.columns = ("user_id", date_key) if date_key else ("user_id",)
+        self.needs_previous = bool(date_key)
+
+    async def _invalidate(self, db, rows: List[dict]):
+        user_ids = [row["user_id"] for row in rows]
+        if self.date_key:
+            await invalidate_month_reports(db, user_ids, [month_key(row[self.date_key]) for row in rows])
+        else:
+            await invalidate_open_reports(db, user_ids)
+
+    async def inserted(self, db, model, rows):
+        await self._invalidate(db, rows)
+
+    async def updated(self, db, model, rows, previous=None):
+        await self._invalidate(db, rows + (previous or []))
+
+    async def deleted(self, db, model, rows):
+        await self._invalidate(db, rows)
+
+
+# Income rows are not listed: the report takes income from the profile, as the client did
+listen(Expense, ReportInvalidator("date"))
+listen(Goal, ReportInvalidator())
+listen(UserProfile, ReportInvalidator())
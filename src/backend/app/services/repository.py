@@ -0,0 +1,182 @@
+"""Single-statement write helpers shared by the routers.
+
+Writes use INSERT/UPDATE/DELETE ... RETURNING so the written row comes back
+from the same round-trip, instead of commit() followed by refresh(). Dialects
+without RETURNING (SQLite before 3.35) fall back to a write plus one SELECT.
+None of these helpers commit; the caller owns the transaction.
+
+Derived data that must change in the same transaction as a write (rollups,
+counters) subscribes with ``listen(model, listener)``.
+"""
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import delete, insert, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class WriteListener:
+    """Hook run inside the writing transaction.
+
+    Rows are plain dicts keyed by column attribute name. Deleted rows carry
+    the primary key plus the attributes listed in ``columns``. Listeners
+    with ``needs_previous`` also get ``previous=`` on updates: the matched
+    rows as they were before the write (one extra SELECT).
+    """
+
+    columns: Sequence[str] = ()
+    needs_previous = False
+
+    async def inserted(self, db: AsyncSession, model, rows: List[dict]):
+        pass
+
+    async def updated(self, db: AsyncSession, model, rows: List[dict]):
+        pass
+
+    async def deleted(self, db: AsyncSession, model, rows: List[dict]):
+        pass
+
+
+_listeners = defaultdict(list)
+
+
+def listen(model, listener: WriteListener):
+    _listeners[model].append(listener)
+
+
+def _dialect(db: AsyncSession):
+    return db.get_bind().dialect
+
+
+def _primary_key(model):
+    return model.__mapper__.primary_key[0]
+
+
+def upsert(db: AsyncSession, model):
+    """Dialect INSERT construct supporting ``on_conflict_do_update`` (PostgreSQL, SQLite)."""
+    dialect = _dialect(db).name
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    raise NotImplementedError(f"upsert is not supported on {dialect}")
+
+
+def _as_dict(model, obj) -> dict:
+    return {attr.key: getattr(obj, attr.key) for attr in inspect(model).column_attrs}
+
+
+async def _notify(db: AsyncSession, model, event: str, rows: List[dict]):
+    if not rows:
+        return
+    for listener in _listeners.get(model, ()):
+        await getattr(listener, event)(db, model, rows)
+
+
+async def insert_one(db: AsyncSession, model, values: Dict[str, Any]):
+    """INSERT one row and return it as an ORM object."""
+    if _dialect(db).insert_returning:
+        obj = await db.scalar(insert(model).values(**values).returning(model))
+    else:
+        result = await db.execute(insert(model.__table__).values(**values))
+        obj = await db.get(model, tuple(result.inserted_primary_key))
+
+    await _notify(db, model, "inserted", [_as_dict(model, obj)])
+    return obj
+
+
+async def insert_many(db: AsyncSession, model, rows: List[Dict[str, Any]]) -> list:
+    """Multi-row INSERT returning ORM objects in input order.
+
+    Every row must carry its primary key (true for the string-id models).
+    """
+    if not rows:
+        return []
+
+    if _dialect(db).insert_returning:
+        result = await db.scalars(insert(model).returning(model, sort_by_parameter_order=True), rows)
+        objs = result.all()
+    else:
+        pk = _primary_key(model)
+        await db.execute(insert(model), rows)
+        ids = [row[pk.key] for row in rows]
+        by_id = {getattr(obj, pk.key): obj for obj in (await db.scalars(select(model).where(pk.in_(ids)))).all()}
+        objs = [by_id[row_id] for row_id in ids]
+
+    await _notify(db, model, "inserted", [_as_dict(model, obj) for obj in objs])
+    return objs
+
+
+async def insert_rows(db: AsyncSession, model, rows: List[Dict[str, Any]]):
+    """executemany INSERT when the caller does not need the rows back."""
+    if rows:
+        await db.execute(insert(model), rows)
+        await _notify(db, model, "inserted", rows)
+
+
+async def _previous_rows(db: AsyncSession, model, criteria: Sequence) -> List[dict]:
+    # Plain columns, so the snapshot does not go through the identity map.
+    # FOR UPDATE keeps a concurrent writer from changing the row in between.
+    keys = [attr.key for attr in inspect(model).column_attrs]
+    stmt = select(*[getattr(model, key) for key in keys]).where(*criteria).with_for_update()
+    rows = (await db.execute(stmt)).all()
+    return [dict(zip(keys, row)) for row in rows]
+
+
+async def update_one(db: AsyncSession, model, criteria: Sequence, values: Dict[str, Any]):
+    """UPDATE the row matching ``criteria`` and return it, or None if no row matched."""
+    if not values:
+        return await db.scalar(select(model).where(*criteria))
+
+    listeners = _listeners.get(model, ())
+    previous = None
+    if any(listener.needs_previous for listener in listeners):
+        previous = await _previous_rows(db, model, criteria)
+
+    stmt = update(model).where(*criteria).values(**values)
+    if _dialect(db).update_returning:
+        obj = await db.scalar(stmt.returning(model))
+    else:
+        result = await db.execute(stmt)
+        if result.rowcount == 0:
+            return None
+        obj = await db.scalar(select(model).where(*criteria).execution_options(populate_existing=True))
+
+    if obj is not None:
+        rows = [_as_dict(model, obj)]
+        for listener in listeners:
+            if listener.needs_previous:
+                await listener.updated(db, model, rows, previous=previous)
+            else:
+                await listener.updated(db, model, rows)
+    return obj
+
+
+async def delete_returning(db: AsyncSession, model, criteria: Sequence, columns: Optional[Sequence] = None) -> list:
+    """DELETE rows matching ``criteria`` and return the given columns of each deleted row.
+
+    ``columns`` defaults to the primary key; with several columns each item is a Row.
+    """
+    pk = _primary_key(model)
+    columns = list(columns or [pk])
+
+    # Listeners may need more of each deleted row than the caller asked for
+    wanted = {column.key: column for column in columns}
+    wanted.setdefault(pk.key, pk)
+    for listener in _listeners.get(model, ()):
+        for key in listener.columns:
+            wanted.setdefault(key, getattr(model, key))
+    fetched = list(wanted.values())
+
+    if _dialect(db).delete_returning:
+        rows = (await db.execute(delete(model).where(*criteria).returning(*fetched))).all()
+    else:
+        rows = (await db.execute(select(*fetched).where(*criteria))).all()
+        await db.execute(delete(model).where(*criteria))
+
+    await _notify(db, model, "deleted", [dict(zip(wanted, row)) for row in rows])
+
+    if len(columns) == 1:
+        return [row[0] for row in rows]
+    return [row[:len(columns)] for row in rows]
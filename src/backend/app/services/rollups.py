@@ -0,0 +1,109 @@
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from sqlalchemy import case, delete, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..models.models import Expense, ExpenseType, Income, MonthlyRollup
+from ..utils.dates import month_of
+from .repository import WriteListener, listen, upsert
+
+INCOME_TYPE = "income"
+
+
+def _month(value) -> str:
+    return value.strftime("%Y-%m")
+
+
+def _type_value(value) -> str:
+    return value.value if isinstance(value, ExpenseType) else str(value)
+
+
+async def apply_deltas(db: AsyncSession, deltas: dict):
+    """Add ``{(user_id, month, category, type): (amount, count)}`` to the rollups.
+
+    One executemany upsert; groups whose count drops to zero are removed.
+    """
+    if not deltas:
+        return
+
+    stmt = upsert(db, MonthlyRollup)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "month", "category", "type"],
+        set_={
+            "total": MonthlyRollup.total + stmt.excluded.total,
+            "count": MonthlyRollup.count + stmt.excluded.count,
+        },
+    )
+    # Sorted keys give concurrent transactions the same lock order
+    await db.execute(stmt, [
+        {"user_id": user_id, "month": month, "category": category, "type": kind, "total": total, "count": count}
+        for (user_id, month, category, kind), (total, count) in sorted(deltas.items())
+    ])
+
+    if any(count < 0 for _total, count in deltas.values()):
+        user_ids = {key[0] for key in deltas}
+        await db.execute(
+            delete(MonthlyRollup).where(MonthlyRollup.user_id.in_(user_ids), MonthlyRollup.count <= 0)
+        )
+
+
+class RollupListener(WriteListener):
+    """Turns expense/income inserts and deletes into rollup deltas."""
+
+    def __init__(self, category_key: str, type_key: Optional[str]):
+        self.category_key = category_key
+        self.type_key = type_key
+        self.columns = tuple(
+            key for key in ("user_id", "date", category_key, type_key, "amount") if key
+        )
+
+    def _deltas(self, rows: Iterable[dict], sign: int) -> dict:
+        deltas = defaultdict(lambda: [0.0, 0])
+        for row in rows:
+            kind = _type_value(row[self.type_key]) if self.type_key else INCOME_TYPE
+            key = (row["user_id"], _month(row["date"]), row[self.category_key], kind)
+            deltas[key][0] += sign * row["amount"]
+            deltas[key][1] += sign
+        return {key: tuple(value) for key, value in deltas.items()}
+
+    async def inserted(self, db, model, rows):
+        await apply_deltas(db, self._deltas(rows, 1))
+
+    async def deleted(self, db, model, rows):
+        await apply_deltas(db, self._deltas(rows, -1))
+
+
+listen(Expense, RollupListener("category", "type"))
+listen(Income, RollupListener("source", None))
+
+
+def rebuild_rollups(db: Session, user_id: Optional[str] = None):
+    """Recompute rollups from the base tables (for one user or everyone)."""
+    clear = delete(MonthlyRollup)
+    if user_id:
+        clear = clear.where(MonthlyRollup.user_id == user_id)
+    db.execute(clear)
+    dialect = db.get_bind().dialect.name
+
+    expense_type = case((Expense.type == ExpenseType.ESSENTIAL, "essential"), else_="non-essential")
+    expense_month = month_of(Expense.date, dialect)
+    expenses = select(
+        Expense.user_id, expense_month, Expense.category, expense_type,
+        func.sum(Expense.amount), func.count(),
+    ).group_by(Expense.user_id, expense_month, Expense.category, Expense.type)
+
+    income_month = month_of(Income.date, dialect)
+    incomes = select(
+        Income.user_id, income_month, Income.source, literal(INCOME_TYPE),
+        func.sum(Income.amount), func.count(),
+    ).group_by(Income.user_id, income_month, Income.source)
+
+    if user_id:
+        expenses = expenses.where(Expense.user_id == user_id)
+        incomes = incomes.where(Income.user_id == user_id)
+
+    columns = ["user_id", "month", "category", "type", "total", "count"]
+    for source in (expenses, incomes):
+        db.execute(MonthlyRollup.__table__.insert().from_select(columns, source))
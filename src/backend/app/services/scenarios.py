@@ -0,0 +1,66 @@
+"""What-if scenario grids evaluated in one vectorized pass.
+
+Each axis is a list of values for one scenario parameter; every combination
+of the axes is a scenario. Axes become sparse broadcastable arrays, so the
+investable amount for the whole grid is a single ``investable_amount`` call.
+"""
+from typing import Dict, List
+
+import numpy as np
+
+from .sip_service import investable_amount, investable_components
+
+AXES = ("income_change", "new_monthly_expense", "new_loan_emi", "sip_step_up", "one_time_expense")
+OUTCOME_COLUMNS = ("income", "outflow", "investable", "change", "recovery_months")
+MAX_SCENARIOS = 10000
+
+
+def grid_shape(axes: Dict[str, List[float]]) -> tuple:
+    return tuple(len(axes[name]) for name in AXES)
+
+
+def evaluate_scenarios(profile, axes: Dict[str, List[float]]) -> dict:
+    """Outcomes for every combination of ``axes``, one row per scenario.
+
+    Rows follow the grid in row-major order over ``AXES`` (the last axis
+    varies fastest). ``recovery_months`` is how long the new investable
+    amount takes to absorb the one-time expense; None when it never does.
+    """
+    income, fixed, loans, sip = investable_components(profile)
+    baseline = investable_amount(income, fixed, loans, sip)
+
+    shape = grid_shape(axes)
+    grid = dict(zip(AXES, np.meshgrid(
+        *(np.asarray(axes[name], dtype=np.float64) for name in AXES), indexing="ij", sparse=True
+    )))
+
+    new_income = income + grid["income_change"]
+    new_fixed = fixed + grid["new_monthly_expense"]
+    new_loans = loans + grid["new_loan_emi"]
+    new_sip = sip + grid["sip_step_up"]
+    outflow = new_fixed + new_loans + new_sip
+    investable = investable_amount(new_income, new_fixed, new_loans, new_sip)
+
+    one_time = np.broadcast_to(grid["one_time_expense"], shape)
+    recovery = np.full(shape, np.nan)
+    np.divide(one_time, investable, out=recovery, where=investable > 0)
+    recovery[one_time <= 0] = 0
+
+    outcomes = np.column_stack([
+        np.broadcast_to(values, shape).ravel()
+        for values in (new_income, outflow, investable, investable - baseline, recovery)
+    ])
+    # NaN -> None so the JSON carries null
+    rows = [[None if value != value else value for value in row] for row in outcomes.tolist()]
+
+    return {
+        "axes": {name: list(axes[name]) for name in AXES},
+        "shape": list(shape),
+        "baseline": {
+            "income": float(income),
+            "outflow": float(fixed + loans + sip),
+            "investable": float(baseline),
+        },
+        "columns": list(OUTCOME_COLUMNS),
+        "outcomes": rows,
+    }
@@ -0,0 +1,150 @@
+"""In-memory index over the sip_schemes table.
+
+Schemes are bucketed by (suitable_for, risk_level). Each bucket is an
+interval index over ``[min_amount, max_amount]`` answering "which schemes
+overlap this amount range" in O(log n + matches), so recommendations do not
+scan the table per request.
+"""
+import asyncio
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core import metrics
+from ..core.config import settings
+from ..models.models import ProfileType, RiskLevel, SIPScheme
+
+
+@dataclass(frozen=True)
+class CatalogScheme:
+    id: int
+    name: str
+    min_amount: float
+    max_amount: float
+    suitable_for: ProfileType
+    risk_level: RiskLevel
+    description: Optional[str]
+
+
+class IntervalIndex:
+    """Static interval index: schemes sorted by ``min_amount`` plus a max-tree.
+
+    ``_tree`` is a segment tree holding the largest ``max_amount`` of each
+    node's range, which lets ``overlapping`` skip whole ranges that end
+    below the query.
+    """
+
+    def __init__(self, schemes: Iterable[CatalogScheme]):
+        self.schemes = sorted(schemes, key=lambda scheme: (scheme.min_amount, scheme.id))
+        self._mins = [scheme.min_amount for scheme in self.schemes]
+
+        self._size = 1
+        while self._size < len(self.schemes):
+            self._size *= 2
+        self._tree = [float("-inf")] * (2 * self._size)
+        for position, scheme in enumerate(self.schemes):
+            self._tree[self._size + position] = scheme.max_amount
+        for node in range(self._size - 1, 0, -1):
+            self._tree[node] = max(self._tree[2 * node], self._tree[2 * node + 1])
+
+    def __len__(self):
+        return len(self.schemes)
+
+    def overlapping(self, low: float, high: float) -> List[CatalogScheme]:
+        """Schemes with ``min_amount <= high`` and ``max_amount >= low``, by min_amount."""
+        # Only the prefix with min_amount <= high can overlap
+        end = bisect_right(self._mins, high)
+        found = []
+        stack = [(1, 0, self._size)]
+        while stack:
+            node, start, stop = stack.pop()
+            if start >= end or self._tree[node] < low:
+                continue
+            if node >= self._size:
+                found.append(start)
+                continue
+            middle = (start + stop) // 2
+            # Right child first so positions pop in ascending order
+            stack.append((2 * node + 1, middle, stop))
+            stack.append((2 * node, start, middle))
+        return [self.schemes[position] for position in found]
+
+
+class SIPCatalog:
+    """Process-wide snapshot of the catalog, rebuilt as a whole on refresh.
+
+    Readers always see one complete snapshot; refresh swaps it atomically.
+    Schemes are written only by seed scripts, outside the API, so changes
+    are picked up after ``SIP_CATALOG_TTL_SECONDS``.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._buckets: Dict[Tuple[ProfileType, RiskLevel], IntervalIndex] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+        self.refreshes = metrics.counter("sip_catalog_refreshes_total", "SIP catalog reloads")
+        metrics.gauge("sip_catalog_schemes", "SIP schemes in the catalog index", lambda: len(self))
+
+    def __len__(self):
+        return sum(len(index) for index in self._buckets.values())
+
+    @property
+    def stale(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl
+
+    def mark_stale(self):
+        self._loaded_at = None
+
+    def load(self, schemes: Iterable[CatalogScheme]):
+        grouped: Dict[Tuple[ProfileType, RiskLevel], list] = {}
+        for scheme in schemes:
+            grouped.setdefault((scheme.suitable_for, scheme.risk_level), []).append(scheme)
+        self._buckets = {key: IntervalIndex(group) for key, group in grouped.items()}
+        self._loaded_at = time.monotonic()
+        self.refreshes.inc()
+
+    async def refresh(self, db: AsyncSession):
+        rows = (await db.execute(select(
+            SIPScheme.id,
+            SIPScheme.name,
+            SIPScheme.min_amount,
+            SIPScheme.max_amount,
+            SIPScheme.suitable_for,
+            SIPScheme.risk_level,
+            SIPScheme.description,
+        ))).all()
+        self.load(CatalogScheme(*row) for row in rows)
+
+    async def ensure_fresh(self, db: AsyncSession):
+        if not self.stale:
+            return
+        async with self._lock:
+            # Another request may have reloaded while we waited
+            if self.stale:
+                await self.refresh(db)
+
+    def match(
+        self,
+        suitable_for: ProfileType,
+        low: float,
+        high: float,
+        risk_levels: Optional[Sequence[RiskLevel]] = None,
+    ) -> List[CatalogScheme]:
+        """Schemes for a profile type whose amount range overlaps ``[low, high]``."""
+        buckets = self._buckets
+        found = []
+        for risk_level in risk_levels or list(RiskLevel):
+            index = buckets.get((suitable_for, risk_level))
+            if index is not None:
+                found.extend(index.overlapping(low, high))
+        return found
+
+
+sip_catalog = SIPCatalog(ttl=settings.SIP_CATALOG_TTL_SECONDS)
+
@@ -0,0 +1,62 @@
+"""SIP projections with annual step-up and inflation over rate x horizon grids.
+
+Contributions are made at the start of each month (as on common SIP
+calculators) and grow by ``step_up`` once a year. Summing the yearly
+instalments is a geometric series, so every grid cell has a closed form and
+the whole grid is one broadcast expression with no per-month loop.
+"""
+from typing import Sequence
+
+import numpy as np
+
+MAX_GRID_AXIS = 500
+
+
+def project_sip(
+    monthly_amount: float,
+    annual_rates: Sequence[float],
+    horizons_years: Sequence[int],
+    step_up: float = 0.0,
+    inflation: float = 0.0,
+) -> dict:
+    """Future value, amount invested and inflation-adjusted value.
+
+    ``future_value`` and ``real_value`` are ``len(annual_rates) x
+    len(horizons_years)`` matrices; ``total_invested`` depends only on the
+    horizon. Rates are annual fractions (0.12 for 12%).
+    """
+    rates = np.asarray(annual_rates, dtype=np.float64)[:, None]
+    years = np.asarray(horizons_years, dtype=np.float64)[None, :]
+
+    monthly_rate = rates / 12
+    year_growth = (1 + monthly_rate) ** 12
+    # Value at year end of one year of start-of-month contributions of 1
+    safe_rate = np.where(monthly_rate == 0, 1, monthly_rate)
+    year_annuity = np.where(monthly_rate == 0, 12.0, (year_growth - 1) / safe_rate * (1 + monthly_rate))
+
+    # sum_k (1 + step_up)^k * year_growth^(years - 1 - k) for k < years
+    step = 1 + step_up
+    gap = year_growth - step
+    near = np.abs(gap) < 1e-9
+    series = np.where(
+        near,
+        years * year_growth ** (years - 1),
+        (year_growth ** years - step ** years) / np.where(near, 1, gap),
+    )
+    future_value = monthly_amount * year_annuity * series
+
+    horizon = years[0]
+    if step_up == 0:
+        total_invested = 12 * monthly_amount * horizon
+    else:
+        total_invested = 12 * monthly_amount * (step ** horizon - 1) / step_up
+
+    real_value = future_value / (1 + inflation) ** years
+
+    return {
+        "annual_rates": list(annual_rates),
+        "horizons_years": list(horizons_years),
+        "total_invested": total_invested.tolist(),
+        "future_value": future_value.tolist(),
+        "real_value": real_value.tolist(),
+    }
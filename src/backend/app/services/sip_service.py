@@ -1,9 +1,14 @@
-def get_monthly_investable_amount(profile):
+import numpy as np
+
+
+def investable_components(profile):
+    """(income, fixed expenses, loan EMIs, SIP commitments) per month.
+
+    Students invest from pocket money and have no deductions.
+    """
     # Student
     if profile.type.value == "student":
-        if not profile.weekly_pocket_money:
-            return 0
-        return profile.weekly_pocket_money * 4
+        return (profile.weekly_pocket_money or 0) * 4, 0, 0, 0
 
     # Employee
     income = profile.monthly_income or 0
@@ -11,10 +16,19 @@ def get_monthly_investable_amount(profile):
     loans = sum(profile.loans.values()) if profile.loans else 0
     sip = profile.sip_commitments or 0
 
-    return max(income - fixed - loans - sip, 0)
+    return income, fixed, loans, sip
+
+
+def investable_amount(income, fixed, loans, sip):
+    """Works on floats and, elementwise with broadcasting, on NumPy arrays."""
+    return np.maximum(income - fixed - loans - sip, 0)
+
+
+def get_monthly_investable_amount(profile):
+    return float(investable_amount(*investable_components(profile)))
 
 
-def suggest_sips(profile, sip_schemes):
+def suggest_sips(profile, catalog):
     investable = get_monthly_investable_amount(profile)
 
     min_limit = investable * 0.10
@@ -22,17 +36,14 @@ def suggest_sips(profile, sip_schemes):
 
     recommendations = []
 
-    for sip in sip_schemes:
-        if (
-            sip.suitable_for == profile.type
-            and sip.min_amount <= max_limit
-            and sip.max_amount >= min_limit
-        ):
-            recommendations.append({
-                "sip_name": sip.name,
-                "risk_level": sip.risk_level.value,
-                "recommended_amount": round(min_limit),
-                "description": sip.description
-            })
+    # Index lookup instead of a scan: schemes for this profile type whose
+    # [min_amount, max_amount] overlaps [min_limit, max_limit]
+    for sip in catalog.match(profile.type, min_limit, max_limit):
+        recommendations.append({
+            "sip_name": sip.name,
+            "risk_level": sip.risk_level.value,
+            "recommended_amount": round(min_limit),
+            "description": sip.description
+        })
 
     return recommendations
@@ -0,0 +1,195 @@
+import codecs
+import csv
+import re
+import uuid
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from ..models.models import ExpenseType
+
+# Same keyword rules as the client-side parsers (utils/fileParser.ts, utils/excelParser.ts)
+ESSENTIAL_CATEGORIES = (
+    "food",
+    "housing",
+    "rent",
+    "transport",
+    "utilities",
+    "health",
+    "education",
+    "groceries",
+    "medical",
+    "insurance",
+)
+
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y", "%m/%d/%Y", "%d %b %Y", "%d-%b-%Y", "%Y/%m/%d")
+EXCEL_EPOCH = date(1899, 12, 30)
+HEADER_SCAN_ROWS = 20
+MAX_REPORTED_ERRORS = 50
+
+_NON_NUMERIC = re.compile(r"[^\d.-]")
+
+
+class ImportFormatError(ValueError):
+    """The uploaded file cannot be read as a statement at all."""
+
+
+def classify_expense(category: str) -> ExpenseType:
+    lowered = category.lower()
+    if any(keyword in lowered for keyword in ESSENTIAL_CATEGORIES):
+        return ExpenseType.ESSENTIAL
+    return ExpenseType.NON_ESSENTIAL
+
+
+def parse_amount(value) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if value is None:
+        return None
+    try:
+        return float(_NON_NUMERIC.sub("", str(value)))
+    except ValueError:
+        return None
+
+
+def parse_date(value) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, (int, float)):
+        # Excel serial day number
+        return EXCEL_EPOCH + timedelta(days=int(value))
+    if not value:
+        return None
+
+    text = str(value).strip()
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).date()
+    except ValueError:
+        pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+class ColumnMap:
+    """Column positions for amount, date, category and description."""
+
+    def __init__(self, amount: int, date: int, category: int, description: int):
+        self.amount = amount
+        self.date = date
+        self.category = category
+        self.description = description
+
+    @classmethod
+    def from_header(cls, header: Sequence) -> Optional["ColumnMap"]:
+        names = [str(cell).lower().strip() if cell is not None else "" for cell in header]
+
+        def find(*keywords):
+            return next((i for i, name in enumerate(names) if any(k in name for k in keywords)), -1)
+
+        amount = find("amount", "cost", "price")
+        if amount == -1:
+            return None
+        return cls(
+            amount=amount,
+            date=find("date", "time"),
+            category=find("category", "type"),
+            description=find("description", "desc", "details", "note"),
+        )
+
+
+# Headerless CSVs follow the client's fixed layout: amount, category, date, description
+POSITIONAL_COLUMNS = ColumnMap(amount=0, category=1, date=2, description=3)
+
+
+def _cell(row: Sequence, index: int):
+    if index < 0 or index >= len(row):
+        return None
+    return row[index]
+
+
+def iter_csv_rows(fileobj) -> Iterator[List[str]]:
+    lines = codecs.iterdecode(fileobj, "utf-8-sig", errors="replace")
+    return csv.reader(lines)
+
+
+def iter_xlsx_rows(fileobj) -> Iterator[tuple]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFormatError("Excel import requires openpyxl to be installed")
+
+    try:
+        workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    except Exception:
+        raise ImportFormatError("Could not read Excel file")
+
+    sheet = workbook.worksheets[0]
+    try:
+        yield from sheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def iter_expense_rows(rows: Iterable[Sequence], user_id: str, today: Optional[date] = None):
+    """Turn raw statement rows into expense dicts ready for a bulk INSERT.
+
+    Yields ``(row_number, values, error)`` where exactly one of values/error
+    is set; blank and non-positive rows are dropped silently, as on the client.
+    """
+    today = today or date.today()
+    rows = iter(rows)
+
+    # Find a header row near the top, otherwise assume the positional layout
+    head = list(islice(rows, HEADER_SCAN_ROWS))
+    columns = POSITIONAL_COLUMNS
+    start = 0
+    for index, row in enumerate(head):
+        text = " ".join(str(cell).lower() for cell in row if cell is not None)
+        has_number = any(parse_amount(cell) for cell in row)
+        if ("amount" in text or "date" in text) and not has_number:
+            columns = ColumnMap.from_header(row)
+            if columns is None:
+                raise ImportFormatError('Could not find an "Amount" column')
+            start = index + 1
+            break
+
+    def all_rows():
+        yield from head[start:]
+        yield from rows
+
+    for row_number, row in enumerate(all_rows(), start=start + 1):
+        if not row or all(cell in (None, "") for cell in row):
+            continue
+
+        amount = parse_amount(_cell(row, columns.amount))
+        if amount is None or amount <= 0:
+            continue
+
+        raw_date = _cell(row, columns.date)
+        expense_date = parse_date(raw_date) if columns.date != -1 else today
+        if expense_date is None:
+            yield row_number, None, f"Unrecognised date: {raw_date}"
+            continue
+
+        category = str(_cell(row, columns.category) or "General").strip()
+        description = str(_cell(row, columns.description) or "Imported Expense").strip()
+
+        yield row_number, {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "amount": amount,
+            "category": category,
+            "date": expense_date,
+            "type": classify_expense(category),
+            "description": description,
+        }, None
+
+
+def take(iterator: Iterator, size: int) -> list:
+    return list(islice(iterator, size))
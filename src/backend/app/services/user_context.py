@@ -0,0 +1,91 @@
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from ..core.cache import TTLCache
+from ..core.config import settings
+from ..models.models import ProfileType, User
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """Detached snapshot of the authenticated user, safe to share across requests."""
+
+    id: str
+    email: str
+    name: str
+    created_at: datetime
+
+    @classmethod
+    def from_model(cls, user) -> "CurrentUser":
+        return cls(id=user.id, email=user.email, name=user.name, created_at=user.created_at)
+
+
+@dataclass(frozen=True)
+class CurrentProfile:
+    """Detached snapshot of a UserProfile row with the same attribute names."""
+
+    id: int
+    user_id: str
+    age: int
+    type: ProfileType
+    onboarding_complete: bool
+    weekly_pocket_money: Optional[float]
+    weekly_expenses: Optional[float]
+    monthly_income: Optional[float]
+    fixed_expenses: Optional[Dict[str, float]]
+    loans: Optional[Dict[str, float]]
+    sip_commitments: Optional[float]
+    savings_preference: Optional[float]
+    auto_split_enabled: Optional[bool]
+    auto_split_percentage: Optional[float]
+
+    @classmethod
+    def from_model(cls, profile) -> "CurrentProfile":
+        values = {field.name: getattr(profile, field.name) for field in fields(cls)}
+        # Copy JSON columns so cached snapshots never alias session state
+        for key in ("fixed_expenses", "loans"):
+            if values[key] is not None:
+                values[key] = dict(values[key])
+        return cls(**values)
+
+
+@dataclass(frozen=True)
+class UserContext:
+    user: CurrentUser
+    profile: Optional[CurrentProfile]
+
+
+user_cache = TTLCache(
+    "user",
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+)
+
+
+async def load_user_context(db: AsyncSession, user_id: str) -> Optional[UserContext]:
+    """Resolve a user and their profile, from cache or with one joined query."""
+    context = user_cache.get(user_id)
+    if context is not None:
+        return context
+
+    user = await db.scalar(
+        select(User).options(joinedload(User.profile)).where(User.id == user_id)
+    )
+    if user is None:
+        return None
+
+    context = UserContext(
+        user=CurrentUser.from_model(user),
+        profile=CurrentProfile.from_model(user.profile) if user.profile else None,
+    )
+    user_cache.set(user_id, context)
+    return context
+
+
+def invalidate_user(user_id: str):
+    user_cache.invalidate(user_id)
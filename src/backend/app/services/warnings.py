@@ -0,0 +1,206 @@
+"""Batch evaluation of the smart-warning rules for every user.
+
+Port of ``analyzeSpendingTrends``, ``checkNonEssentialLimits`` and
+``checkGoalThreats`` (utils/financialIntelligence.ts). Per-user inputs are
+aggregated in SQL (monthly_rollups, goals), loaded into NumPy arrays aligned
+on the profile order, and each rule is one array expression over all users.
+"""
+from dataclasses import dataclass
+from datetime import date, datetime
+from itertools import islice
+from typing import Iterator, List, Optional
+
+import numpy as np
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from ..models.models import Goal, MonthlyRollup, ProfileType, SmartWarning, UserProfile
+from .rollups import INCOME_TYPE
+
+SPIKE_RATIO = 1.2
+NON_ESSENTIAL_LIMIT = 0.3
+DAYS_PER_MONTH = 30
+READ_CHUNK_SIZE = 50000
+WRITE_CHUNK_SIZE = 10000
+
+
+@dataclass
+class WarningInputs:
+    """Per-user inputs; every array is indexed like ``user_ids``."""
+
+    user_ids: List[str]
+    income: np.ndarray
+    fixed_outflow: np.ndarray
+    current_total: np.ndarray
+    last_total: np.ndarray
+    non_essential: np.ndarray
+    goal_need: np.ndarray
+
+
+def _fetch_columns(db: Session, stmt, count: int) -> List[list]:
+    columns = [[] for _ in range(count)]
+    result = db.execute(stmt.execution_options(yield_per=READ_CHUNK_SIZE))
+    for partition in result.partitions():
+        for column, values in zip(columns, zip(*partition)):
+            column.extend(values)
+    return columns
+
+
+def _floats(values: list) -> np.ndarray:
+    # NULL columns arrive as None, which NumPy turns into NaN
+    return np.nan_to_num(np.array(values, dtype=np.float64))
+
+
+def _json_sums(values: list) -> np.ndarray:
+    return np.fromiter((sum(value.values()) if value else 0.0 for value in values), np.float64, len(values))
+
+
+def _positions(index: dict, user_ids: list) -> np.ndarray:
+    return np.fromiter((index.get(user_id, -1) for user_id in user_ids), np.int64, len(user_ids))
+
+
+def _month_key(value: date) -> str:
+    return value.strftime("%Y-%m")
+
+
+def _previous_month(value: date) -> date:
+    first = value.replace(day=1)
+    if first.month == 1:
+        return first.replace(year=first.year - 1, month=12)
+    return first.replace(month=first.month - 1)
+
+
+def load_inputs(db: Session, now: datetime) -> WarningInputs:
+    user_ids, types, pocket, weekly, monthly, fixed, loans, sip = _fetch_columns(db, select(
+        UserProfile.user_id,
+        UserProfile.type,
+        UserProfile.weekly_pocket_money,
+        UserProfile.weekly_expenses,
+        UserProfile.monthly_income,
+        UserProfile.fixed_expenses,
+        UserProfile.loans,
+        UserProfile.sip_commitments,
+    ), 8)
+    n = len(user_ids)
+    index = {user_id: position for position, user_id in enumerate(user_ids)}
+
+    student = np.fromiter((kind == ProfileType.STUDENT for kind in types), bool, n)
+    income = np.where(student, _floats(pocket) * 4, _floats(monthly))
+    fixed_outflow = np.where(
+        student,
+        _floats(weekly) * 4,
+        _json_sums(fixed) + _json_sums(loans) + _floats(sip),
+    )
+
+    current, last = _month_key(now), _month_key(_previous_month(now))
+    rollup_users, months, kinds, totals = _fetch_columns(db, select(
+        MonthlyRollup.user_id, MonthlyRollup.month, MonthlyRollup.type, MonthlyRollup.total,
+    ).where(MonthlyRollup.month.in_([current, last]), MonthlyRollup.type != INCOME_TYPE), 4)
+    positions = _positions(index, rollup_users)
+    months = np.array(months, dtype=str)
+    totals = np.array(totals, dtype=np.float64)
+    known = positions >= 0
+    is_current = known & (months == current)
+    is_last = known & (months == last)
+    is_non_essential = is_current & (np.array(kinds, dtype=str) == "non-essential")
+
+    def per_user(mask):
+        return np.bincount(positions[mask], weights=totals[mask], minlength=n)
+
+    goal_users, targets, saved, deadlines = _fetch_columns(db, select(
+        Goal.user_id, Goal.target_amount, Goal.saved_amount, Goal.deadline,
+    ).where(Goal.saved_amount < Goal.target_amount), 4)
+    goal_positions = _positions(index, goal_users)
+    remaining_seconds = (
+        np.array(deadlines, dtype="datetime64[D]").astype("datetime64[s]") - np.datetime64(now, "s")
+    ) / np.timedelta64(1, "s")
+    months_remaining = np.maximum(1.0, remaining_seconds / (86400 * DAYS_PER_MONTH))
+    monthly_need = (np.array(targets, dtype=np.float64) - np.array(saved, dtype=np.float64)) / months_remaining
+    known_goals = goal_positions >= 0
+
+    return WarningInputs(
+        user_ids=user_ids,
+        income=income,
+        fixed_outflow=fixed_outflow,
+        current_total=per_user(is_current),
+        last_total=per_user(is_last),
+        non_essential=per_user(is_non_essential),
+        goal_need=np.bincount(goal_positions[known_goals], weights=monthly_need[known_goals], minlength=n),
+    )
+
+
+def _js_round(values: np.ndarray) -> np.ndarray:
+    # Math.round semantics (halves round up), unlike Python's round()
+    return np.floor(values + 0.5).astype(np.int64)
+
+
+def evaluate(inputs: WarningInputs, now: datetime) -> Iterator[dict]:
+    """Yield one smart_warnings row per triggered rule and user."""
+    spike = (inputs.last_total > 0) & (inputs.current_total > inputs.last_total * SPIKE_RATIO)
+
+    has_income = inputs.income > 0
+    over_limit = has_income & (inputs.non_essential > inputs.income * NON_ESSENTIAL_LIMIT)
+    share = np.zeros_like(inputs.income)
+    np.divide(inputs.non_essential * 100, inputs.income, out=share, where=has_income)
+
+    remaining = inputs.income - inputs.fixed_outflow - inputs.current_total
+    threatened = (inputs.goal_need > 0) & (remaining < inputs.goal_need)
+    shortfall = inputs.goal_need - remaining
+
+    user_ids = inputs.user_ids
+    for position in np.flatnonzero(spike):
+        yield {
+            "user_id": user_ids[position],
+            "id": "trend-spike",
+            "type": "warning",
+            "title": "Spending Spike Detected",
+            "message": "You've spent 20% more this month compared to last month. Check your recent transactions.",
+            "icon": "TrendingUp",
+            "date": now,
+        }
+
+    positions = np.flatnonzero(over_limit)
+    for position, percent in zip(positions, _js_round(share[positions])):
+        yield {
+            "user_id": user_ids[position],
+            "id": "limit-non-essential",
+            "type": "danger",
+            "title": "High Discretionary Spending",
+            "message": f"Your non-essential spending is {percent}% of your income. Recommended limit is 30%.",
+            "icon": "AlertTriangle",
+            "date": now,
+        }
+
+    positions = np.flatnonzero(threatened)
+    for position, amount in zip(positions, _js_round(shortfall[positions])):
+        yield {
+            "user_id": user_ids[position],
+            "id": "goal-threat",
+            "type": "warning",
+            "title": "Goals at Risk",
+            "message": (
+                "Your current spending might impact your ability to reach your goals. "
+                f"You need ₹{amount} more to stay on track."
+            ),
+            "icon": "Target",
+            "date": now,
+        }
+
+
+def refresh_warnings(db: Session, now: Optional[datetime] = None) -> int:
+    """Replace every stored warning with a fresh evaluation; returns the row count.
+
+    Does not commit, so readers keep the previous set until the caller does.
+    """
+    now = now or datetime.utcnow()
+    inputs = load_inputs(db, now)
+
+    db.execute(delete(SmartWarning))
+    rows = evaluate(inputs, now)
+    written = 0
+    while True:
+        chunk = list(islice(rows, WRITE_CHUNK_SIZE))
+        if not chunk:
+            return written
+        db.execute(insert(SmartWarning), chunk)
+        written += len(chunk)
@@ -0,0 +1,8 @@
+from sqlalchemy import func
+
+
+def month_of(column, dialect_name: str):
+    """"YYYY-MM" bucket of a DATE column, in the given dialect's SQL."""
+    if dialect_name == "postgresql":
+        return func.to_char(column, "YYYY-MM")
+    return func.strftime("%Y-%m", column)
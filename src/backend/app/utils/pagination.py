@@ -0,0 +1,51 @@
+import base64
+import json
+from datetime import date
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(row_date: date, row_id: str) -> str:
+    raw = json.dumps([row_date.isoformat(), row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[date, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        row_date, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return date.fromisoformat(row_date), str(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+async def keyset_page(db: AsyncSession, stmt, date_column, id_column, cursor: Optional[str], limit: int):
+    """Return one page of rows ordered newest first by (date, id).
+
+    The cursor is the (date, id) of the last row of the previous page, so
+    each page is a single range scan on a (user_id, date, id) index.
+    ``stmt`` selects plain columns (including date and id); rows are Row tuples.
+    """
+    if cursor:
+        cursor_date, cursor_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(date_column, id_column) < (cursor_date, cursor_id))
+
+    stmt = stmt.order_by(date_column.desc(), id_column.desc()).limit(limit + 1)
+    rows = (await db.execute(stmt)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, date_column.key), getattr(last, id_column.key))
+
+    return rows, next_cursor
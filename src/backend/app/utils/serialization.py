@@ -0,0 +1,19 @@
+from typing import Iterable, List, Optional, Type
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def response_columns(model, schema: Type[BaseModel]) -> list:
+    """Model columns matching the fields of a response schema, in schema order."""
+    return [getattr(model, name) for name in schema.model_fields]
+
+
+def rows_response(rows: Iterable, columns: List, headers: Optional[dict] = None) -> ORJSONResponse:
+    """Encode column-tuple rows straight to JSON with orjson.
+
+    Skips per-row response_model validation: the rows come from our own
+    tables through the schema's columns, so they already have the right shape.
+    """
+    keys = [column.key for column in columns]
+    return ORJSONResponse([dict(zip(keys, row)) for row in rows], headers=headers)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""Concurrent-request throughput: blocking Session vs AsyncSession.
+
+Serves the same expense page query two ways inside one FastAPI app:
+
+  /before  - async handler calling the synchronous Session (old routers)
+  /after   - async handler awaiting the AsyncSession (current routers)
+
+and fires concurrent requests at each through httpx's ASGI transport.
+
+Usage:
+    pip install httpx
+    python bench_concurrency.py --requests 500 --concurrency 50 --latency 0.02
+
+--latency adds a per-query sleep inside the database call to mimic a remote
+(Neon) round-trip, so the effect of blocking the event loop is visible even
+against a local database.
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add the backend directory to sys.path
+backend_path = Path(__file__).parent
+sys.path.insert(0, str(backend_path))
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import event, select, text
+
+from app.core.database import AsyncSessionLocal, Base, SessionLocal, async_engine, engine
+from app.models.models import Expense, ExpenseType, User
+
+BENCH_EMAIL = "bench@fingenius.local"
+
+
+def install_sleep_function(latency: float):
+    """Expose sleep_ms() to SQL so both drivers pay the same simulated latency."""
+    if engine.dialect.name != "sqlite":
+        return f"SELECT pg_sleep({latency})"
+
+    def register(dbapi_connection, _record):
+        dbapi_connection.create_function("sleep_ms", 1, lambda ms: time.sleep(ms / 1000.0))
+
+    event.listen(engine, "connect", register)
+    event.listen(async_engine.sync_engine, "connect", register)
+    return f"SELECT sleep_ms({int(latency * 1000)})"
+
+
+def seed_user(rows: int) -> str:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.email == BENCH_EMAIL).first()
+        if user:
+            return user.id
+
+        user = User(id=str(uuid.uuid4()), email=BENCH_EMAIL, name="Bench", password_hash="-")
+        db.add(user)
+        start = date(2023, 1, 1)
+        db.add_all(
+            Expense(
+                id=str(uuid.uuid4()),
+                user_id=user.id,
+                amount=100 + i % 50,
+                category="Food",
+                date=start + timedelta(days=i % 365),
+                type=ExpenseType.ESSENTIAL,
+                description=f"bench {i}",
+            )
+            for i in range(rows)
+        )
+        db.commit()
+        return user.id
+    finally:
+        db.close()
+
+
+def build_app(user_id: str, latency_sql: str) -> FastAPI:
+    app = FastAPI()
+    page = (
+        select(Expense)
+        .where(Expense.user_id == user_id)
+        .order_by(Expense.date.desc(), Expense.id.desc())
+        .limit(100)
+    )
+
+    @app.get("/before")
+    async def before():
+        db = SessionLocal()
+        try:
+            if latency_sql:
+                db.execute(text(latency_sql))
+            return len(db.scalars(page).all())
+        finally:
+            db.close()
+
+    @app.get("/after")
+    async def after():
+        async with AsyncSessionLocal() as db:
+            if latency_sql:
+                await db.execute(text(latency_sql))
+            return len((await db.scalars(page)).all())
+
+    return app
+
+
+async def run(app: FastAPI, path: str, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one():
+            async with semaphore:
+                response = await client.get(path)
+                response.raise_for_status()
+
+        await one()  # warm up the pool
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        return requests / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02, help="simulated DB round-trip in seconds")
+    parser.add_argument("--rows", type=int, default=2000, help="expenses seeded for the bench user")
+    args = parser.parse_args()
+
+    latency_sql = install_sleep_function(args.latency) if args.latency > 0 else ""
+    app = build_app(seed_user(args.rows), latency_sql)
+
+    print(f"\n=== {args.requests} requests, concurrency {args.concurrency}, latency {args.latency}s ===\n")
+    for label, path in (("before (sync Session)", "/before"), ("after (AsyncSession)", "/after")):
+        throughput = asyncio.run(run(app, path, args.requests, args.concurrency))
+        print(f"{label:<24} {throughput:8.1f} req/s")
+    print()
+
+
+if __name__ == "__main__":
+    main()
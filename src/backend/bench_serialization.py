@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Microbenchmark: list response serialization, ORM + response_model vs fast path.
+
+  current - load Expense ORM objects, validate each through
+            List[ExpenseResponse], jsonable_encoder, stdlib json
+  fast    - load plain column tuples, zip into dicts, orjson
+
+Runs against a throwaway in-memory SQLite database.
+
+Usage:
+    python bench_serialization.py --rows 5000 --repeat 20
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import List
+
+# Add the backend directory to sys.path
+backend_path = Path(__file__).parent
+sys.path.insert(0, str(backend_path))
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "bench")
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.models.models import Expense, ExpenseType
+from app.schemas.schemas import ExpenseResponse
+from app.utils.serialization import response_columns
+
+
+def seed(session: Session, rows: int):
+    start = date(2023, 1, 1)
+    session.add_all(
+        Expense(
+            id=str(uuid.uuid4()),
+            user_id="bench",
+            amount=100 + i % 50,
+            category="Food" if i % 2 else "Shopping",
+            date=start + timedelta(days=i % 365),
+            type=ExpenseType.ESSENTIAL if i % 2 else ExpenseType.NON_ESSENTIAL,
+            description=f"bench expense {i}",
+            created_at=datetime(2024, 1, 1),
+        )
+        for i in range(rows)
+    )
+    session.commit()
+
+
+def current_path(session: Session, adapter: TypeAdapter) -> bytes:
+    expenses = session.scalars(select(Expense).where(Expense.user_id == "bench")).all()
+    validated = adapter.validate_python(expenses, from_attributes=True)
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def fast_path(session: Session, columns: list) -> bytes:
+    rows = session.execute(select(*columns).where(Expense.user_id == "bench")).all()
+    keys = [column.key for column in columns]
+    return orjson.dumps([dict(zip(keys, row)) for row in rows])
+
+
+def best_of(repeat: int, func, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Expense.__table__.create(engine)
+    adapter = TypeAdapter(List[ExpenseResponse])
+    columns = response_columns(Expense, ExpenseResponse)
+
+    with Session(engine) as session:
+        seed(session, args.rows)
+        session.expunge_all()
+
+        # Both paths must produce the same documents
+        assert json.loads(current_path(session, adapter)) == json.loads(fast_path(session, columns))
+
+        current = best_of(args.repeat, current_path, session, adapter)
+        fast = best_of(args.repeat, fast_path, session, columns)
+
+    print(f"\n=== {args.rows} expenses, best of {args.repeat} ===\n")
+    print(f"current (ORM + response_model + json) {current * 1000:8.1f} ms")
+    print(f"fast    (columns + orjson)            {fast * 1000:8.1f} ms")
+    print(f"speedup                               {current / fast:8.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+"""Evaluate the smart-warning rules for every user and replace smart_warnings.
+
+Usage:
+    python evaluate_warnings.py
+
+Run it from cron (e.g. hourly); GET /warnings serves the stored result.
+"""
+import sys
+import time
+from pathlib import Path
+
+# Add the backend directory to sys.path
+backend_path = Path(__file__).parent
+sys.path.insert(0, str(backend_path))
+
+from app.core.database import SessionLocal
+from app.services.warnings import refresh_warnings
+
+db = SessionLocal()
+try:
+    started = time.perf_counter()
+    written = refresh_warnings(db)
+    db.commit()
+    print(f"{written} warnings written in {time.perf_counter() - started:.1f}s.")
+finally:
+    db.close()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""Ingest daily NAV history into the memory-mapped NAV store.
+
+Usage:
+    python ingest_nav.py <file.csv> [<file.csv> ...]
+    python ingest_nav.py --fund "Large Cap SIP" <file.csv>
+
+Each CSV holds one fund's history: a date column and a NAV column, found by
+header name ("date", "nav" / "net asset value") or taken as the first two
+columns. Without --fund the fund name is the file name. Rows are merged into
+the existing series; re-ingesting a date overwrites its NAV.
+"""
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+# Add the backend directory to sys.path
+backend_path = Path(__file__).parent
+sys.path.insert(0, str(backend_path))
+
+from app.services.nav_store import nav_store
+from app.services.statement_import import parse_amount, parse_date
+
+
+def read_rows(path: Path):
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        sample = handle.read(4096)
+        handle.seek(0)
+        dialect = csv.Sniffer().sniff(sample, delimiters=",;\t") if sample else csv.excel
+        reader = csv.reader(handle, dialect)
+
+        date_column, nav_column = 0, 1
+        for row in reader:
+            names = [cell.lower().strip() for cell in row]
+            if any("date" in name for name in names):
+                date_column = next(i for i, name in enumerate(names) if "date" in name)
+                nav_column = next(
+                    (i for i, name in enumerate(names) if "nav" in name or "net asset value" in name),
+                    nav_column,
+                )
+                continue
+            if len(row) <= max(date_column, nav_column):
+                continue
+            day = parse_date(row[date_column])
+            nav = parse_amount(row[nav_column])
+            if day is not None and nav is not None and nav > 0:
+                yield day, nav
+
+
+parser = argparse.ArgumentParser(description="Ingest NAV history CSV files")
+parser.add_argument("files", nargs="+", type=Path)
+parser.add_argument("--fund", help="fund name (defaults to each file's name)")
+args = parser.parse_args()
+
+if args.fund and len(args.files) > 1:
+    parser.error("--fund applies to a single file")
+
+for path in args.files:
+    fund = args.fund or path.stem
+    count = nav_store.write(fund, read_rows(path))
+    print(f"{fund}: {count} NAVs -> {nav_store.path(fund)}")
@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+"""Rebuild monthly_rollups from the expenses and incomes tables.
+
+Usage:
+    python rebuild_rollups.py              # every user
+    python rebuild_rollups.py <user_id>    # one user
+"""
+import sys
+from pathlib import Path
+
+# Add the backend directory to sys.path
+backend_path = Path(__file__).parent
+sys.path.insert(0, str(backend_path))
+
+from app.core.database import SessionLocal
+from app.services.rollups import rebuild_rollups
+
+user_id = sys.argv[1] if len(sys.argv) > 1 else None
+
+db = SessionLocal()
+try:
+    rebuild_rollups(db, user_id)
+    db.commit()
+    print(f"Rollups rebuilt for {'user ' + user_id if user_id else 'all users'}.")
+finally:
+    db.close()
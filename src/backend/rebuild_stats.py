@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+"""Rebuild system_stats (the admin dashboard totals) from the base tables.
+
+Usage:
+    python rebuild_stats.py
+"""
+import sys
+from pathlib import Path
+
+# Add the backend directory to sys.path
+backend_path = Path(__file__).parent
+sys.path.insert(0, str(backend_path))
+
+from app.core.database import SessionLocal
+from app.services.admin_stats import rebuild_stats
+
+db = SessionLocal()
+try:
+    rebuild_stats(db)
+    db.commit()
+    print("System stats rebuilt.")
+finally:
+    db.close()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+"""Revalue investments from the NAV store and write current_value / returns.
+
+Usage:
+    python refresh_returns.py              # every user
+    python refresh_returns.py <user_id>    # one user
+"""
+import sys
+import time
+from pathlib import Path
+
+# Add the backend directory to sys.path
+backend_path = Path(__file__).parent
+sys.path.insert(0, str(backend_path))
+
+from app.core.database import SessionLocal
+from app.services.portfolio import refresh_returns
+
+user_id = sys.argv[1] if len(sys.argv) > 1 else None
+
+db = SessionLocal()
+try:
+    started = time.perf_counter()
+    result = refresh_returns(db, user_id)
+    db.commit()
+    print(
+        f"{len(result.ids)} investments across {len(result.portfolios)} portfolios "
+        f"revalued in {time.perf_counter() - started:.1f}s."
+    )
+finally:
+    db.close()